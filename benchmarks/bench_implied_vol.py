@@ -0,0 +1,42 @@
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from options.black_scholes import price_chain
+from options.implied_vol import implied_volatility
+
+
+if __name__ == "__main__":
+    n = 50_000
+    rng = np.random.default_rng(0)
+
+    S = 100.0
+    K = rng.uniform(50, 150, n)
+    T = rng.uniform(0.02, 2.0, n)
+    r = 0.05
+    sigma = rng.uniform(0.05, 1.0, n)
+    option_type = np.where(rng.random(n) < 0.5, "call", "put")
+
+    call, put = price_chain(S, K, T, r, sigma)
+    price = np.where(option_type == "call", call, put)
+
+    # Quotes with less than a cent of time value do not pin down a vol.
+    intrinsic = np.where(
+        option_type == "call",
+        np.maximum(S - K * np.exp(-r * T), 0.0),
+        np.maximum(K * np.exp(-r * T) - S, 0.0),
+    )
+    price = np.where(price - intrinsic >= 0.01, price, np.nan)
+    quoted = ~np.isnan(price)
+
+    start_time = time.perf_counter()
+    iv = implied_volatility(price, S, K, T, r, option_type)
+    elapsed = time.perf_counter() - start_time
+
+    solved = ~np.isnan(iv)
+    print(f"Solved {solved.sum()}/{quoted.sum()} quotes in {elapsed * 1e3:.1f} ms")
+    print(f"Max |iv - sigma| on solved quotes: {np.abs(iv[solved] - sigma[solved]).max():.2e}")
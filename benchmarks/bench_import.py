@@ -0,0 +1,40 @@
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).parent.parent
+STATEMENT = "from strategies.hedge import HedgeDelta"
+HEAVY_MODULES = ["matplotlib", "yfinance", "mplfinance", "plotly", "pandas"]
+
+
+def cold_start(statement: str, runs: int = 10) -> float:
+    '''
+    Median wall time (seconds) of a fresh interpreter running `statement`,
+    minus the median of a bare interpreter start.
+    '''
+    def median_run(code: str) -> float:
+        timer = (
+            "import time; t = time.perf_counter(); "
+            f"exec({code!r}); print(time.perf_counter() - t)"
+        )
+        times = [
+            float(subprocess.run([sys.executable, "-c", timer], cwd=ROOT,
+                                 capture_output=True, text=True, check=True).stdout)
+            for _ in range(runs)
+        ]
+        return statistics.median(times)
+
+    return median_run(statement) - median_run("pass")
+
+
+def loaded_heavy_modules(statement: str) -> list[str]:
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    modules = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout.split()
+    return [m for m in HEAVY_MODULES if m in modules]
+
+
+if __name__ == "__main__":
+    print(f"Cold start of `{STATEMENT}`: {cold_start(STATEMENT) * 1e3:.1f} ms")
+    print(f"Heavy modules loaded: {loaded_heavy_modules(STATEMENT) or 'none'}")
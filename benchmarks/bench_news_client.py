@@ -0,0 +1,116 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+import hashlib
+import json
+import sys
+import threading
+import time
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from news.fetch_news import NewsAPI
+
+LATENCY = 0.2          # seconds per stub response
+TOTAL_RESULTS = 40     # articles per stream
+
+STREAMS = [
+    {"endpoint": "top-headlines", "params": {"country": "us", "category": category, "pageSize": 20}}
+    for category in ("business", "technology", "science", "health", "general")
+] + [
+    {"endpoint": "everything", "params": {"q": q, "language": "en", "pageSize": 20}}
+    for q in ("earnings", "merger", "ipo", "guidance", "layoffs")
+]
+
+
+class StubNewsHandler(BaseHTTPRequestHandler):
+    '''
+    Minimal NewsAPI stand-in: deterministic paged articles per query, a
+    strong ETag per page, 304 on If-None-Match, and a 429 with Retry-After
+    on the first request of every query marked "flaky".
+    '''
+    protocol_version = "HTTP/1.1"
+    seen_flaky = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        time.sleep(LATENCY)
+
+        if query.get("q") == "flaky":
+            with self.lock:
+                first = url.query not in self.seen_flaky
+                self.seen_flaky.add(url.query)
+            if first:
+                return self._send(429, b"", {"Retry-After": "0"})
+
+        page = int(query.get("page", 1))
+        page_size = int(query.get("pageSize", 20))
+        stream = query.get("category") or query.get("q") or "headlines"
+        start = (page - 1) * page_size
+        articles = [
+            {"title": f"{stream} story {k}", "description": f"About {stream}", "url": f"https://example.com/{stream}/{k}"}
+            for k in range(start, min(start + page_size, TOTAL_RESULTS))
+        ]
+        body = json.dumps({"status": "ok", "totalResults": TOTAL_RESULTS, "articles": articles}).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, b"", {"ETag": etag})
+        self._send(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def stub_server():
+    '''
+    Start the stub on a free local port; returns (server, base_url).
+    '''
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubNewsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/"
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    server, base_url = stub_server()
+    api = NewsAPI(api_key="stub", base_url=base_url, max_workers=10, backoff_factor=0)
+
+    baseline = NewsAPI(api_key="stub", base_url=base_url, max_workers=10, backoff_factor=0)
+    sequential, t_seq = timed(lambda: [
+        a for s in STREAMS for a in baseline._get(s["endpoint"], {**s["params"], "page": 1}, conditional=False)["articles"]
+    ])
+    print(f"sequential, 10 streams x 1 page:  {t_seq:6.2f}s  {len(sequential)} articles")
+
+    first, t_first = timed(lambda: api.fetch_many(STREAMS))
+    print(f"fetch_many, 10 streams x 1 page:  {t_first:6.2f}s  {len(first)} articles")
+
+    paged = [{**s, "pages": 2} for s in STREAMS]
+    fresh = NewsAPI(api_key="stub", base_url=base_url, max_workers=10, backoff_factor=0)
+    both, t_paged = timed(lambda: fresh.fetch_many(paged))
+    print(f"fetch_many, 10 streams x 2 pages: {t_paged:6.2f}s  {len(both)} articles")
+
+    unchanged, t_304 = timed(lambda: api.fetch_many(STREAMS))
+    print(f"fetch_many, unchanged (304):      {t_304:6.2f}s  {len(unchanged)} articles")
+
+    flaky, t_flaky = timed(lambda: api.fetch_many([{"endpoint": "everything", "params": {"q": "flaky", "pageSize": 20}}]))
+    print(f"fetch_many, 429 then retry:       {t_flaky:6.2f}s  {len(flaky)} articles")
+
+    print(f"\nround-trip latency: {LATENCY:.2f}s")
+    server.shutdown()
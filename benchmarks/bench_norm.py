@@ -0,0 +1,51 @@
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import scipy.stats as si
+
+from options.normal import norm_cdf, norm_pdf
+
+
+def bench(label: str, fn, number: int):
+    elapsed = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<28} {elapsed * 1e6:12.3f} us/call")
+    return elapsed
+
+
+if __name__ == "__main__":
+    x = 0.3
+    xs = np.random.default_rng(0).standard_normal(1_000_000)
+
+    print("Single contract (scalar):")
+    old = bench("si.norm.cdf(x, 0.0, 1.0)", lambda: si.norm.cdf(x, 0.0, 1.0), 20_000)
+    new = bench("norm_cdf(x)", lambda: norm_cdf(x), 20_000)
+    print(f"  speedup: {old / new:.1f}x")
+    old = bench("si.norm.pdf(x, 0.0, 1.0)", lambda: si.norm.pdf(x, 0.0, 1.0), 20_000)
+    new = bench("norm_pdf(x)", lambda: norm_pdf(x), 20_000)
+    print(f"  speedup: {old / new:.1f}x")
+
+    print("1M-element array:")
+    old = bench("si.norm.cdf(xs, 0.0, 1.0)", lambda: si.norm.cdf(xs, 0.0, 1.0), 5)
+    new = bench("norm_cdf(xs)", lambda: norm_cdf(xs), 5)
+    print(f"  speedup: {old / new:.1f}x")
+    old = bench("si.norm.pdf(xs, 0.0, 1.0)", lambda: si.norm.pdf(xs, 0.0, 1.0), 5)
+    new = bench("norm_pdf(xs)", lambda: norm_pdf(xs), 5)
+    print(f"  speedup: {old / new:.1f}x")
+
+    grid = np.linspace(-38, 38, 200_001)
+    reference = si.norm.cdf(grid)
+    mask = reference > 0
+
+    rel_err = np.abs(norm_cdf(grid)[mask] - reference[mask]) / reference[mask]
+    print(f"Max relative cdf error vs scipy.stats, array path, |x| <= 38: {rel_err.max():.2e}")
+
+    # The scalar path (math.erfc) only runs for Python floats, so evaluate
+    # the grid point by point.
+    scalar = np.array([norm_cdf(float(v)) for v in grid])
+    rel_err = np.abs(scalar - reference) / np.where(mask, reference, 1.0)
+    for label, region in (("-38 <= x <= 8", mask & (grid <= 8)), ("|x| <= 5", np.abs(grid) <= 5)):
+        print(f"Max relative cdf error vs scipy.stats, scalar path, {label}: {rel_err[region].max():.2e}")
@@ -0,0 +1,94 @@
+from pathlib import Path
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+SAMPLE_NEWS = ROOT / "src" / "data" / "sample_news.json"
+BACKENDS = ("pytorch", "quantized", "onnx")
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load_texts() -> list[str]:
+    with open(SAMPLE_NEWS) as f:
+        articles = json.load(f)
+    return [f"{a.get('title', '')}. {a.get('description', '')}" for a in articles]
+
+
+def run_backend(backend: str) -> dict:
+    '''
+    Measure one backend in the current process and return its metrics.
+    '''
+    from news.sentiment import SentimentAnalyzer
+
+    texts = load_texts()
+    baseline_rss = rss_mb()
+
+    start_time = time.perf_counter()
+    analyzer = SentimentAnalyzer(backend=backend)
+    load_time = time.perf_counter() - start_time
+
+    analyzer.analyze(texts[0])  # warm-up
+    latencies = []
+    for text in texts:
+        start_time = time.perf_counter()
+        analyzer.analyze(text)
+        latencies.append(time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    results = analyzer.analyze_batch(texts)
+    batch_time = time.perf_counter() - start_time
+
+    return {
+        "backend": backend,
+        "load_s": load_time,
+        "p50_latency_ms": statistics.median(latencies) * 1e3,
+        "throughput_per_s": len(texts) / batch_time,
+        "rss_mb": rss_mb() - baseline_rss,
+        "labels": [r["label"] for r in results],
+        "signals": [r["signal"] for r in results],
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--backend":
+        print(json.dumps(run_backend(sys.argv[2])))
+        sys.exit(0)
+
+    # Each backend runs in a fresh interpreter so RSS figures are not shared.
+    reports = {}
+    for backend in BACKENDS:
+        proc = subprocess.run([sys.executable, __file__, "--backend", backend],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{backend}: failed\n{proc.stderr.strip().splitlines()[-1]}")
+            continue
+        reports[backend] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    reference = reports.get("pytorch")
+    for backend, report in reports.items():
+        line = (f"{backend:<10} load {report['load_s']:6.2f}s  "
+                f"p50 {report['p50_latency_ms']:7.1f} ms  "
+                f"{report['throughput_per_s']:7.1f} texts/s  "
+                f"RSS +{report['rss_mb']:7.1f} MB")
+        if reference:
+            n = len(reference["labels"])
+            labels = sum(a == b for a, b in zip(report["labels"], reference["labels"])) / n
+            signals = sum(a == b for a, b in zip(report["signals"], reference["signals"])) / n
+            line += f"  label agreement {labels:.1%}  signal agreement {signals:.1%}"
+        print(line)
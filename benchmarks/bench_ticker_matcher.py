@@ -0,0 +1,63 @@
+from pathlib import Path
+import json
+import random
+import string
+import sys
+import time
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.pipeline.tickers import TickerExtractor
+
+SAMPLE_NEWS = ROOT / "src" / "data" / "sample_news.json"
+
+
+def synthetic_mappings(n: int, seed: int = 0) -> dict:
+    '''
+    {name: ticker} for n made-up one- to three-word company names.
+    '''
+    rng = random.Random(seed)
+    mappings = {}
+    while len(mappings) < n:
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        mappings[" ".join(words)] = "".join(rng.choices(string.ascii_uppercase, k=4))
+    return mappings
+
+
+def substring_extract(mappings: dict, text: str) -> set[str]:
+    '''
+    The previous per-mapping `company in text_lower` scan, for comparison.
+    '''
+    text_lower = text.lower()
+    return {ticker for company, ticker in mappings.items() if company in text_lower}
+
+
+def bench(label: str, fn, texts: list[str], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start_time)
+    per_text = best / len(texts) * 1e6
+    print(f"  {label:<22} {per_text:10.1f} us/text")
+    return per_text
+
+
+if __name__ == "__main__":
+    with open(SAMPLE_NEWS) as f:
+        articles = json.load(f)
+    texts = [t for a in articles for t in (a.get("title") or "", a.get("description") or "")]
+
+    for size in (len(TickerExtractor.COMPANY_TICKERS), 10_000):
+        mappings = {**TickerExtractor.COMPANY_TICKERS, **synthetic_mappings(size - len(TickerExtractor.COMPANY_TICKERS))}
+        extractor = TickerExtractor(custom_mappings=mappings)
+
+        print(f"{len(extractor.mappings)} mappings, {len(texts)} texts:")
+        old = bench("substring scan", lambda t: substring_extract(extractor.mappings, t), texts)
+        new = bench("CompanyMatcher.find", extractor.matcher.find, texts)
+        print(f"  speedup: {old / new:.1f}x")
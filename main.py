@@ -2,4 +2,4 @@ from src.pipeline.orchestrator import NewsOrchestrator
 
 if __name__ == "__main__":
     orchestrator = NewsOrchestrator()
-    orchestrator.run_cycle()
\ No newline at end of file
+    orchestrator.run_service()
@@ -1,10 +1,101 @@
-import yfinance as yf
 import numpy as np
-import scipy.stats as si
-import matplotlib.pyplot as plt
-import mplfinance as mpf
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Optional
+
+from options.normal import norm_cdf, norm_pdf
+
+
+def _d1_d2(S, K, T, r, sigma):
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / sigma_sqrt_T
+    return d1, d1 - sigma_sqrt_T
+
+
+def price_chain(S, K, T, r, sigma):
+    """
+    Price calls and puts for a whole option chain in one vectorized pass.
+
+    Args:
+        S: Spot price(s)
+        K: Strike price(s)
+        T: Time(s) to expiry in years
+        r: Risk-free rate(s)
+        sigma: Volatility(ies)
+
+    All inputs are broadcast against each other, so e.g. a scalar spot with
+    arrays of strikes and expiries prices the full chain.
+
+    Returns:
+        Tuple (call, put) of float64 arrays with the broadcast shape.
+    """
+    S, K, T, r, sigma = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma))
+    )
+    d1, d2 = _d1_d2(S, K, T, r, sigma)
+    discounted_K = K * np.exp(-r * T)
+
+    call = S * norm_cdf(d1) - discounted_K * norm_cdf(d2)
+    put = discounted_K * norm_cdf(-d2) - S * norm_cdf(-d1)
+    return call, put
+
+
+@dataclass
+class Greeks:
+    delta_call: np.ndarray
+    delta_put: np.ndarray
+    gamma: np.ndarray
+    theta_call: np.ndarray
+    theta_put: np.ndarray
+    vega: np.ndarray
+    rho_call: np.ndarray
+    rho_put: np.ndarray
+    vanna: np.ndarray
+    volga: np.ndarray
+    charm: np.ndarray   # identical for calls and puts without dividends
+
+
+def greeks(S, K, T, r, sigma) -> Greeks:
+    """
+    Evaluate all Greeks for calls and puts from a single pass over d1, d2,
+    the normal pdf/cdf values and the discount factor.
+
+    Args:
+        S, K, T, r, sigma: Scalars or arrays, broadcast as in price_chain
+
+    Returns:
+        Greeks dataclass whose fields have the broadcast shape.
+    """
+    S, K, T, r, sigma = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma))
+    )
+    sqrt_T = np.sqrt(T)
+    sigma_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+
+    pdf_d1 = norm_pdf(d1)
+    cdf_d1 = norm_cdf(d1)
+    cdf_d2 = norm_cdf(d2)
+    cdf_minus_d1 = norm_cdf(-d1)
+    cdf_minus_d2 = norm_cdf(-d2)
+    discounted_K = K * np.exp(-r * T)
+
+    vega = S * pdf_d1 * sqrt_T
+    decay = -S * pdf_d1 * sigma / (2 * sqrt_T)
+
+    return Greeks(
+        delta_call=cdf_d1,
+        delta_put=-cdf_minus_d1,
+        gamma=pdf_d1 / (S * sigma_sqrt_T),
+        theta_call=decay - r * discounted_K * cdf_d2,
+        theta_put=decay + r * discounted_K * cdf_minus_d2,
+        vega=vega,
+        rho_call=T * discounted_K * cdf_d2,
+        rho_put=-T * discounted_K * cdf_minus_d2,
+        vanna=-pdf_d1 * d2 / sigma,
+        volga=vega * d1 * d2 / sigma,
+        charm=-pdf_d1 * (2 * r * T - d2 * sigma_sqrt_T) / (2 * T * sigma_sqrt_T),
+    )
 
 
 class BlackScholesModel:
@@ -24,136 +115,161 @@ class BlackScholesModel:
     def call_price(self):
         d1 = self.d1()
         d2 = self.d2()
-        call = (self.S * si.norm.cdf(d1, 0.0, 1.0) - self.K * np.exp(-self.r * self.T) * si.norm.cdf(d2, 0.0, 1.0))
+        call = (self.S * norm_cdf(d1) - self.K * np.exp(-self.r * self.T) * norm_cdf(d2))
         return call
     
     def put_price(self):
         d1 = self.d1()
         d2 = self.d2()
-        put = (self.K * np.exp(-self.r * self.T) * si.norm.cdf(-d2, 0.0, 1.0) - self.S * si.norm.cdf(-d1, 0.0, 1.0))
+        put = (self.K * np.exp(-self.r * self.T) * norm_cdf(-d2) - self.S * norm_cdf(-d1))
         return put
+
+    def prices(self):
+        return price_chain(self.S, self.K, self.T, self.r, self.sigma)
     
 
 class BlackScholesGreeks(BlackScholesModel):
     def delta(self, option_type):
         if option_type == 'call':
-            return si.norm.cdf(self.d1(), 0.0, 1.0)
+            return norm_cdf(self.d1())
         else:
-            return -si.norm.cdf(-self.d1(), 0.0, 1.0)
+            return -norm_cdf(-self.d1())
         
     def gamma(self):
-        return si.norm.pdf(self.d1(), 0.0, 1.0) / (self.S * self.sigma * np.sqrt(self.T))
+        return norm_pdf(self.d1()) / (self.S * self.sigma * np.sqrt(self.T))
     
     def theta(self, option_type):
         if option_type == 'call':
-            return (-self.S * si.norm.pdf(self.d1(), 0.0, 1.0) * self.sigma / (2 * np.sqrt(self.T)) - self.r * self.K * np.exp(-self.r * self.T) * si.norm.cdf(self.d2(), 0.0, 1.0))
+            return (-self.S * norm_pdf(self.d1()) * self.sigma / (2 * np.sqrt(self.T)) - self.r * self.K * np.exp(-self.r * self.T) * norm_cdf(self.d2()))
         else:
-            return (-self.S * si.norm.pdf(self.d1(), 0.0, 1.0) * self.sigma / (2 * np.sqrt(self.T)) + self.r * self.K * np.exp(-self.r * self.T) * si.norm.cdf(-self.d2(), 0.0, 1.0))
+            return (-self.S * norm_pdf(self.d1()) * self.sigma / (2 * np.sqrt(self.T)) + self.r * self.K * np.exp(-self.r * self.T) * norm_cdf(-self.d2()))
 
     def vega(self):
-        return self.S * si.norm.pdf(self.d1(), 0.0, 1.0) * np.sqrt(self.T)
+        return self.S * norm_pdf(self.d1()) * np.sqrt(self.T)
     
     def rho(self, option_type):
         if option_type == 'call':
-            return self.K * self.T * np.exp(-self.r * self.T) * si.norm.cdf(self.d2(), 0.0, 1.0)
+            return self.K * self.T * np.exp(-self.r * self.T) * norm_cdf(self.d2())
         else:
-            return -self.K * self.T * np.exp(-self.r * self.T) * si.norm.cdf(-self.d2(), 0.0, 1.0)
+            return -self.K * self.T * np.exp(-self.r * self.T) * norm_cdf(-self.d2())
+
+    def greeks(self) -> Greeks:
+        return greeks(self.S, self.K, self.T, self.r, self.sigma)
 
 
 class BlackScholesVisualizer:
+    GREEK_PANELS = [
+        ("Delta", [("delta_call", "Delta Call", "blue"), ("delta_put", "Delta Put", "red")]),
+        ("Gamma", [("gamma", "Gamma", "green")]),
+        ("Theta", [("theta_call", "Theta Call", "blue"), ("theta_put", "Theta Put", "red")]),
+        ("Vega", [("vega", "Vega", "purple")]),
+        ("Rho", [("rho_call", "Rho Call", "blue"), ("rho_put", "Rho Put", "red")]),
+    ]
+
     @staticmethod
-    def plot_option_prices(S, K, T, r, sigma):
-        S_range = np.linspace(0.5 * S, 1.5 * S, 100)
-        call_prices = []
-        put_prices = []
-        
-        for s in S_range:
-            model = BlackScholesModel(s, K, T, r, sigma)
-            call_prices.append(model.call_price())
-            put_prices.append(model.put_price())
-        
+    def option_price_curves(S, K, T, r, sigma, points: int = 100) -> dict:
+        S_range = np.linspace(0.5 * S, 1.5 * S, points)
+        call, put = price_chain(S_range, K, T, r, sigma)
+        return {"S": S_range, "call": call, "put": put}
+
+    @staticmethod
+    def greek_curves(S, K, T, r, sigma, points: int = 100) -> dict:
+        S_range = np.linspace(0.5 * S, 1.5 * S, points)
+        return {"S": S_range, **vars(greeks(S_range, K, T, r, sigma))}
+
+    @staticmethod
+    def surface(S, K, T, r, sigma, value: str = "call", axis: str = "sigma", resolution: int = 200) -> dict:
+        '''
+        Evaluate `value` ("call", "put" or any Greeks field) over a
+        spot x `axis` grid, where `axis` is "sigma" or "T".
+
+        Returns:
+            Dict with the "S" and `axis` grid vectors and a
+            (resolution, resolution) array under "values".
+        '''
+        S_range = np.linspace(0.5 * S, 1.5 * S, resolution)
+        if axis == "sigma":
+            other = np.linspace(0.05, 2 * sigma, resolution)
+            args = (S_range[None, :], K, T, r, other[:, None])
+        elif axis == "T":
+            other = np.linspace(T / resolution, T, resolution)
+            args = (S_range[None, :], K, other[:, None], r, sigma)
+        else:
+            raise ValueError(f"Unknown surface axis: {axis}")
+
+        if value in ("call", "put"):
+            call, put = price_chain(*args)
+            values = call if value == "call" else put
+        else:
+            values = getattr(greeks(*args), value)
+
+        return {"S": S_range, axis: other, "values": values}
+
+    @staticmethod
+    def _finish(show: bool, save_path: Optional[str]):
+        import matplotlib.pyplot as plt
+
+        if save_path:
+            plt.savefig(save_path)
+        if show:
+            plt.show()
+        else:
+            plt.close()
+
+    @staticmethod
+    def plot_option_prices(S, K, T, r, sigma, show: bool = True, save_path: Optional[str] = None) -> dict:
+        import matplotlib.pyplot as plt
+
+        curves = BlackScholesVisualizer.option_price_curves(S, K, T, r, sigma)
+
         plt.figure(figsize=(10, 6))
-        plt.plot(S_range, call_prices, label='Call Option Price', color='blue')
-        plt.plot(S_range, put_prices, label='Put Option Price', color='red')
+        plt.plot(curves["S"], curves["call"], label='Call Option Price', color='blue')
+        plt.plot(curves["S"], curves["put"], label='Put Option Price', color='red')
         plt.title('Black-Scholes Option Prices')
         plt.xlabel('Stock Price')
         plt.ylabel('Option Price')
         plt.legend()
         plt.grid()
-        plt.show()
+        BlackScholesVisualizer._finish(show, save_path)
+        return curves
 
+    @staticmethod
+    def plot_greeks(S, K, T, r, sigma, show: bool = True, save_path: Optional[str] = None) -> dict:
+        import matplotlib.pyplot as plt
 
+        curves = BlackScholesVisualizer.greek_curves(S, K, T, r, sigma)
 
-    @staticmethod
-    def plot_greeks(S, K, T, r, sigma):
-        S_range = np.linspace(0.5 * S, 1.5 * S, 100)
-        deltas_call = []
-        deltas_put = []
-        gammas = []
-        thetas_call = []
-        thetas_put = []
-        vegas = []
-        rhos_call = []
-        rhos_put = []
-        
-        for s in S_range:
-            greeks = BlackScholesGreeks(s, K, T, r, sigma)
-            deltas_call.append(greeks.delta('call'))
-            deltas_put.append(greeks.delta('put'))
-            gammas.append(greeks.gamma())
-            thetas_call.append(greeks.theta('call'))
-            thetas_put.append(greeks.theta('put'))
-            vegas.append(greeks.vega())
-            rhos_call.append(greeks.rho('call'))
-            rhos_put.append(greeks.rho('put'))
-        
         plt.figure(figsize=(12, 8))
-        
-        plt.subplot(2, 3, 1)
-        plt.plot(S_range, deltas_call, label='Delta Call', color='blue')
-        plt.plot(S_range, deltas_put, label='Delta Put', color='red')
-        plt.title('Delta')
-        plt.xlabel('Stock Price')
-        plt.ylabel('Delta')
-        plt.legend()
-        plt.grid()
-        
-        plt.subplot(2, 3, 2)
-        plt.plot(S_range, gammas, label='Gamma', color='green')
-        plt.title('Gamma')
-        plt.xlabel('Stock Price')
-        plt.ylabel('Gamma')
-        plt.legend()
-        plt.grid()
-        
-        plt.subplot(2, 3, 3)
-        plt.plot(S_range, thetas_call, label='Theta Call', color='blue')
-        plt.plot(S_range, thetas_put, label='Theta Put', color='red')
-        plt.title('Theta')
-        plt.xlabel('Stock Price')
-        plt.ylabel('Theta')
-        plt.legend()
-        plt.grid()
-        
-        plt.subplot(2, 3, 4)
-        plt.plot(S_range, vegas, label='Vega', color='purple')
-        plt.title('Vega')
-        plt.xlabel('Stock Price')
-        plt.ylabel('Vega')
-        plt.legend()
-        plt.grid()
-        
-        plt.subplot(2, 3, 5)
-        plt.plot(S_range, rhos_call, label='Rho Call', color='blue')
-        plt.plot(S_range, rhos_put, label='Rho Put', color='red')
-        plt.title('Rho')
-        plt.xlabel('Stock Price')
-        plt.ylabel('Rho')
-        plt.legend()
-        plt.grid()
+
+        for i, (title, lines) in enumerate(BlackScholesVisualizer.GREEK_PANELS, start=1):
+            plt.subplot(2, 3, i)
+            for field, label, color in lines:
+                plt.plot(curves["S"], curves[field], label=label, color=color)
+            plt.title(title)
+            plt.xlabel('Stock Price')
+            plt.ylabel(title)
+            plt.legend()
+            plt.grid()
 
         plt.tight_layout()
-        plt.show()
+        BlackScholesVisualizer._finish(show, save_path)
+        return curves
+
+    @staticmethod
+    def plot_surface(S, K, T, r, sigma, value: str = "call", axis: str = "sigma", resolution: int = 200,
+                     show: bool = True, save_path: Optional[str] = None) -> dict:
+        import matplotlib.pyplot as plt
+
+        grid = BlackScholesVisualizer.surface(S, K, T, r, sigma, value, axis, resolution)
+
+        plt.figure(figsize=(10, 7))
+        plt.pcolormesh(grid["S"], grid[axis], grid["values"], shading='auto', cmap='viridis')
+        plt.colorbar(label=value)
+        plt.title(f'Black-Scholes {value} surface')
+        plt.xlabel('Stock Price')
+        plt.ylabel('Volatility' if axis == "sigma" else 'Time to Expiry')
+        BlackScholesVisualizer._finish(show, save_path)
+        return grid
 
 
 if __name__ == "__main__":
@@ -165,4 +281,6 @@ if __name__ == "__main__":
     sigma = 0.2 
 
     BlackScholesVisualizer.plot_option_prices(S, K, T, r, sigma)
-    BlackScholesVisualizer.plot_greeks(S, K, T, r, sigma)
\ No newline at end of file
+    BlackScholesVisualizer.plot_greeks(S, K, T, r, sigma)
+    BlackScholesVisualizer.plot_surface(S, K, T, r, sigma, value="call", axis="sigma")
+    BlackScholesVisualizer.plot_surface(S, K, T, r, sigma, value="gamma", axis="T")
\ No newline at end of file
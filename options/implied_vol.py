@@ -0,0 +1,110 @@
+import numpy as np
+
+from options.black_scholes import _d1_d2
+from options.normal import norm_cdf, norm_pdf
+
+SIGMA_LOWER = 1e-6
+SIGMA_UPPER = 10.0
+
+
+def _price_and_vega(S, K, T, r, sigma, is_call):
+    d1, d2 = _d1_d2(S, K, T, r, sigma)
+    discounted_K = K * np.exp(-r * T)
+    call = S * norm_cdf(d1) - discounted_K * norm_cdf(d2)
+    put = discounted_K * norm_cdf(-d2) - S * norm_cdf(-d1)
+    vega = S * norm_pdf(d1) * np.sqrt(T)
+    return np.where(is_call, call, put), vega
+
+
+def _initial_guess(price, S, discounted_K, T, is_call):
+    # Corrado-Miller works on call prices; map puts through put-call parity.
+    call = np.where(is_call, price, price + S - discounted_K)
+    half_gap = 0.5 * (S - discounted_K)
+    inner = (call - half_gap) ** 2 - half_gap ** 2 / np.pi
+    guess = (
+        np.sqrt(2 * np.pi / T) / (S + discounted_K)
+        * (call - half_gap + np.sqrt(np.maximum(inner, 0.0)))
+    )
+    return np.clip(guess, 0.01, 5.0)
+
+
+def implied_volatility(price, S, K, T, r, option_type="call", tol: float = 1e-8, max_iter: int = 100):
+    """
+    Solve Black-Scholes implied volatility for a whole chain at once.
+
+    Each element runs Newton-Raphson on vega from a Corrado-Miller initial
+    guess. A per-element [lower, upper] bracket is tightened on every
+    iteration, and any Newton step that leaves the bracket (or has a
+    vanishing vega) falls back to bisection. Converged elements are dropped
+    from the working set, so late iterations only touch the stragglers.
+
+    Args:
+        price: Market option price(s)
+        S, K, T, r: Spot, strike, time to expiry (years) and rate(s)
+        option_type: "call"/"put", or an array of them; anything else
+            raises ValueError
+        tol: Absolute price tolerance for convergence
+        max_iter: Iteration cap per element
+
+    All inputs are broadcast against each other.
+
+    Returns:
+        Float64 array of implied vols. Quotes outside the no-arbitrage bounds
+        (max(intrinsic, 0) < price < S for calls, < K*exp(-rT) for puts),
+        non-positive expiries, and elements that did not converge within
+        max_iter are NaN.
+    """
+    price, S, K, T, r, option_type = np.broadcast_arrays(
+        np.asarray(price, dtype=np.float64),
+        np.asarray(S, dtype=np.float64),
+        np.asarray(K, dtype=np.float64),
+        np.asarray(T, dtype=np.float64),
+        np.asarray(r, dtype=np.float64),
+        np.asarray(option_type),
+    )
+    shape = price.shape
+    price, S, K, T, r = (x.ravel() for x in (price, S, K, T, r))
+    is_call = (option_type == "call").ravel()
+    unknown = ~is_call & (option_type != "put").ravel()
+    if unknown.any():
+        raise ValueError(f"Unknown option type: {option_type.ravel()[unknown][0]}")
+
+    sigma = np.full(price.shape, np.nan)
+
+    with np.errstate(invalid="ignore"):
+        discounted_K = K * np.exp(-r * T)
+        lower_bound = np.where(is_call, np.maximum(S - discounted_K, 0.0), np.maximum(discounted_K - S, 0.0))
+        upper_bound = np.where(is_call, S, discounted_K)
+        valid = (T > 0) & (price > lower_bound) & (price < upper_bound)
+
+    idx = np.flatnonzero(valid)
+    p, s, k, t, rr, c = price[idx], S[idx], K[idx], T[idx], r[idx], is_call[idx]
+    lo = np.full(idx.shape, SIGMA_LOWER)
+    hi = np.full(idx.shape, SIGMA_UPPER)
+    vol = _initial_guess(p, s, discounted_K[idx], t, c)
+
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+
+        model, vega = _price_and_vega(s, k, t, rr, vol, c)
+        diff = model - p
+
+        done = np.abs(diff) < tol
+        sigma[idx[done]] = vol[done]
+
+        # Price is increasing in vol, so the sign of diff tightens the bracket.
+        too_high = diff > 0
+        hi = np.where(too_high, vol, hi)
+        lo = np.where(too_high, lo, vol)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = vol - diff / vega
+        use_newton = (vega > 1e-12) & (newton > lo) & (newton < hi)
+        vol = np.where(use_newton, newton, 0.5 * (lo + hi))
+
+        keep = ~done
+        idx, p, s, k, t, rr, c = idx[keep], p[keep], s[keep], k[keep], t[keep], rr[keep], c[keep]
+        lo, hi, vol = lo[keep], hi[keep], vol[keep]
+
+    return sigma.reshape(shape)
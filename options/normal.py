@@ -0,0 +1,30 @@
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+# Standard normal kernels used by the pricing hot path.
+#
+# scipy.stats.norm.cdf/pdf validate arguments and apply loc/scale on every
+# call, which costs microseconds per scalar. The array path goes straight to
+# the scipy.special.ndtr ufunc; the scalar path uses math.erfc and skips
+# NumPy dispatch entirely. The array path is bit-identical to scipy.stats.norm
+# (both evaluate Cephes ndtr); the scalar path has a max relative error of
+# ~5e-13 against it over -38 <= x <= 8, deep in the left tail, and ~1e-14
+# for |x| <= 5. See benchmarks/bench_norm.py.
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def norm_cdf(x):
+    if isinstance(x, (float, int)):
+        return 0.5 * math.erfc(-x * _INV_SQRT_2)
+    return ndtr(x)
+
+
+def norm_pdf(x):
+    if isinstance(x, (float, int)):
+        return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+    x = np.asarray(x, dtype=np.float64)
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
@@ -1,4 +1,5 @@
 from dotenv import load_dotenv
+from pathlib import Path
 import os
 
 load_dotenv()
@@ -6,8 +7,47 @@ load_dotenv()
 BASE_URL = "https://newsapi.org/v2/"
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY")
 
+# Query streams fetched concurrently each cycle, see NewsAPI.fetch_many
+NEWS_STREAMS = [
+    {"endpoint": "top-headlines", "params": {"country": "us", "category": "business", "pageSize": 100}, "pages": 1},
+]
+NEWS_POLL_INTERVAL = 900  # seconds between fetch cycles in run_service
+
+PIPELINE_QUEUE_SIZE = 256  # items buffered between orchestrator stages
+
+AGGREGATION_HALF_LIFE = 6 * 3600  # seconds for a mention's weight in ticker rankings to halve
+AGGREGATION_TOP_K = 10            # tickers kept in the incrementally maintained ranking
+
+ARTICLE_STORE_PATH = os.getenv(
+    "ARTICLE_STORE_PATH", str(Path(__file__).parent.parent / "data" / "articles.sqlite3")
+)
+DEDUPE_MAX_SIZE = 50_000           # URL/title keys remembered exactly
+DEDUPE_TTL = 7 * 24 * 3600         # seconds a key is remembered, None for no expiry
+# Keys evicted beyond DEDUPE_MAX_SIZE (not expired by the TTL) are remembered
+# approximately by a Bloom filter, None to disable. Each false positive drops
+# a genuinely new article as a duplicate: up to ~2 x the error rate of new
+# articles (two keys each) once the filter is full.
+DEDUPE_BLOOM_CAPACITY = 1_000_000
+DEDUPE_BLOOM_ERROR_RATE = 1e-4
+DEDUPE_PATH = os.getenv(
+    "DEDUPE_PATH", str(Path(__file__).parent.parent / "data" / "dedupe.sqlite3")
+)
+
+ARTICLE_RETENTION_DAYS = 90  # compaction drops older articles; None keeps everything
+
 SENTIMENT_POSITIVE_THRESHOLD = 0.7
 SENTIMENT_NEGATIVE_THRESHOLD = 0.7
 
+SENTIMENT_BATCH_SIZE = 32
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "pytorch")  # pytorch, quantized or onnx
+ONNX_MODEL_DIR = os.getenv(  # ONNX exports, made once per model and reused on later starts
+    "ONNX_MODEL_DIR", str(Path(__file__).parent.parent / "data" / "onnx")
+)
+
+SENTIMENT_CACHE_SIZE = 10_000
+SENTIMENT_CACHE_PATH = os.getenv(
+    "SENTIMENT_CACHE_PATH", str(Path(__file__).parent.parent / "data" / "sentiment_cache.sqlite3")
+)
+
 if __name__ == "__main__":
     print(NEWSAPI_KEY)
\ No newline at end of file
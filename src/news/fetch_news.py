@@ -1,25 +1,69 @@
 import requests
 import json
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional
 from pathlib import Path
 import sys
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import NEWSAPI_KEY, BASE_URL
 
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
 class NewsAPI:
-    def __init__(self):
-        self.api_key = NEWSAPI_KEY
-        self.base_url = BASE_URL
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 max_workers: int = 8,
+                 retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 session: Optional[requests.Session] = None):
+        """
+        Args:
+            api_key: NewsAPI key (defaults to NEWSAPI_KEY)
+            base_url: API root (defaults to BASE_URL); point it at a local
+                stub server to run offline
+            max_workers: Concurrent requests in fetch_many, also the
+                connection pool size
+            retries: Retries on connection errors and 429/5xx responses,
+                with exponential backoff and Retry-After honored
+            session: Preconfigured session to use instead of the pooled one
+        """
+        self.api_key = api_key or NEWSAPI_KEY
+        self.base_url = base_url or BASE_URL
+        self.max_workers = max_workers
 
         if not self.api_key:
             raise ValueError("NEWSAPI_KEY not found in environment variables.")
 
-    
-    def fetch_news(self, 
-                   language: str = "en", 
+        if session is None:
+            retry = Retry(total=retries,
+                          backoff_factor=backoff_factor,
+                          status_forcelist=RETRY_STATUSES,
+                          allowed_methods=["GET"],
+                          respect_retry_after_header=True)
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.session.headers["X-Api-Key"] = self.api_key
+
+        # {request key: {"etag", "last_modified"}} for conditional requests
+        self._validators = {}
+        self._validators_lock = threading.Lock()
+
+    def fetch_news(self,
+                   language: str = "en",
                    page_size: int = 50):
-        
+
         '''
         Fetch latest news
         Optional params: {
@@ -29,21 +73,105 @@ class NewsAPI:
         }
 
         '''
-        
-        endpoint = f"{self.base_url}top-headlines"
+
         params = {
             "country": "us",
             "category": "business",
             "language": language,
             "pageSize": page_size,
-            "apiKey": self.api_key
         }
 
-        response = requests.get(endpoint, params=params, timeout=30)
+        data = self._get("top-headlines", params, conditional=False)
+        return data.get("articles", [])
+
+    def fetch_many(self, streams: list[dict], conditional: bool = True) -> list[dict]:
+        '''
+        Fetch several query streams concurrently.
+
+        Args:
+            streams: Dicts with "endpoint" ("top-headlines" or "everything"),
+                "params" (NewsAPI query params) and optional "pages" (max
+                pages to fetch, default 1)
+            conditional: Send If-None-Match/If-Modified-Since from the
+                previous response; unchanged (304) pages contribute nothing,
+                and a stream whose first page is unchanged is not paged further
+
+        Returns:
+            Articles from all streams and pages, in stream then page order.
+            A page that still fails after the retries is logged and
+            skipped; the other streams are unaffected.
+        '''
+        pages = sorted(self._iter_pages(streams, conditional), key=lambda p: (p[0], p[1]))
+        return [article for _, _, data in pages for article in data.get("articles", [])]
+
+    def iter_many(self, streams: list[dict], conditional: bool = True):
+        '''
+        Like fetch_many, but yields articles as soon as each page arrives
+        (in completion order), so downstream work overlaps the fetch.
+        '''
+        for _, _, data in self._iter_pages(streams, conditional):
+            yield from data.get("articles", [])
+
+    def _iter_pages(self, streams: list[dict], conditional: bool):
+        """
+        Yield (stream index, page, payload) in completion order. Follow-up
+        pages of a stream are requested as soon as its first page reports
+        totalResults. Failed requests are logged and skipped, so one broken
+        stream does not cost the others their pages.
+        """
+        def get(index, page):
+            stream = streams[index]
+            return index, page, self._get(stream["endpoint"], {**stream["params"], "page": page}, conditional)
+
+        requested = {}  # {future: (stream index, page)}
+
+        def submit(index, page):
+            future = pool.submit(get, index, page)
+            requested[future] = index, page
+            return future
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = {submit(index, 1) for index in range(len(streams))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, page = requested.pop(future)
+                    try:
+                        _, _, data = future.result()
+                    except requests.RequestException as e:
+                        stream = streams[index]
+                        print(f"Fetch failed for {stream['endpoint']} {stream['params']} page {page}: {e}")
+                        continue
+                    if page == 1:
+                        stream = streams[index]
+                        page_size = stream["params"].get("pageSize", 20)
+                        total_pages = math.ceil(data.get("totalResults", 0) / page_size)
+                        for follow_up in range(2, min(stream.get("pages", 1), total_pages) + 1):
+                            pending.add(submit(index, follow_up))
+                    yield index, page, data
+
+    def _get(self, endpoint: str, params: dict, conditional: bool) -> dict:
+        key = (endpoint, tuple(sorted(params.items())))
+        headers = {}
+        if conditional:
+            with self._validators_lock:
+                validators = self._validators.get(key, {})
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self.session.get(f"{self.base_url}{endpoint}", params=params, headers=headers, timeout=30)
+        if response.status_code == 304:
+            return {}
         response.raise_for_status()
-        data = response.json()
 
-        return data.get("articles", [])
+        with self._validators_lock:
+            self._validators[key] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        return response.json()
 
 if __name__ == "__main__":
     # Sample use case
@@ -51,7 +179,6 @@ if __name__ == "__main__":
     articles = news_api.fetch_news()
     with open('data/sample_news.json', 'w') as j:
         json.dump(articles, j, indent=4)
-        
+
     for article in articles:
         print(f"Title: {article['title']}\nDescription: {article['description']}\n")
-
@@ -3,17 +3,85 @@ import torch
 import time
 
 from pathlib import Path
+from typing import Optional
+import os
+import shutil
 import sys
+import tempfile
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.settings import SENTIMENT_POSITIVE_THRESHOLD, SENTIMENT_NEGATIVE_THRESHOLD
+from config.settings import (
+    SENTIMENT_POSITIVE_THRESHOLD,
+    SENTIMENT_NEGATIVE_THRESHOLD,
+    SENTIMENT_BATCH_SIZE,
+    SENTIMENT_BACKEND,
+    ONNX_MODEL_DIR,
+)
+from news.sentiment_cache import SentimentCache
+
+BACKENDS = ("pytorch", "quantized", "onnx")
+
+
+def export_onnx(model_name: str, root: str = ONNX_MODEL_DIR) -> Path:
+    """
+    Export a Hugging Face model to ONNX under `root`, unless an export is
+    already there.
+
+    The export is written to a temporary directory and renamed into place,
+    so concurrent callers never load a half-written model; if several
+    export at once, the first rename wins.
+
+    Returns:
+        Directory of the export, loadable with export=False.
+    """
+    target = Path(root) / model_name.replace("/", "--")
+    if (target / "model.onnx").exists():
+        return target
+
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+    except ImportError as e:
+        raise ImportError(
+            "The onnx backend requires optimum[onnxruntime]: pip install 'optimum[onnxruntime]'"
+        ) from e
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name}-")
+    try:
+        ORTModelForSequenceClassification.from_pretrained(model_name, export=True).save_pretrained(staging)
+        try:
+            os.rename(staging, target)
+        except OSError:
+            if not (target / "model.onnx").exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return target
+
 
 class SentimentAnalyzer:
-    def __init__(self, model_name: str = "ProsusAI/finbert"):
-        self.device = 0 if torch.cuda.is_available() else -1
+    def __init__(self, 
+                 model_name: str = "ProsusAI/finbert", 
+                 cache: Optional[SentimentCache] = None,
+                 backend: str = SENTIMENT_BACKEND):
+        """
+        Args:
+            model_name: Hugging Face model id
+            cache: Optional SentimentCache in front of inference
+            backend: "pytorch" (full precision), "quantized" (dynamic int8
+                torch, CPU) or "onnx" (ONNX Runtime via optimum, CPU)
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown sentiment backend: {backend}")
+
+        self.model_name = model_name
+        self.backend = backend
+        self.cache = cache
+        self.cache_namespace = model_name if backend == "pytorch" else f"{model_name}:{backend}"
+        self.device = 0 if torch.cuda.is_available() and backend == "pytorch" else -1
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        self.model = self._load_model(model_name, backend)
         
         self.pipe = pipeline("text-classification", 
                              model=self.model,
@@ -23,25 +91,72 @@ class SentimentAnalyzer:
         self.positive_threshold = SENTIMENT_POSITIVE_THRESHOLD
         self.negative_threshold = SENTIMENT_NEGATIVE_THRESHOLD
     
+    @staticmethod
+    def _load_model(model_name: str, backend: str):
+        if backend == "onnx":
+            path = export_onnx(model_name)
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            return ORTModelForSequenceClassification.from_pretrained(path, export=False)
+
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        if backend == "quantized":
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return model
+    
     def analyze(self, text: str) -> dict:
-        result = self.pipe(text)[0]
+        if self.cache is None:
+            return self._to_result(self.pipe(text)[0])
+
+        key = self.cache.key(text, self.cache_namespace)
+        result = self.cache.get(key)
+        if result is None:
+            result = self.pipe(text)[0]
+            self.cache.put(key, result)
+        return self._to_result(result)
+    
+    def analyze_batch(self, texts: list[str], batch_size: int = SENTIMENT_BATCH_SIZE) -> list[dict]:
+        """
+        Score many texts with batched inference.
+
+        Cached texts and repeats within the batch are served without
+        inference. The remaining texts are sorted by length before batching
+        so each batch pads to a similar length, and results are returned in
+        the input order.
+        """
+        if not texts:
+            return []
+
+        keys = [self.cache.key(t, self.cache_namespace) for t in texts] if self.cache is not None else texts
+        raw = [None] * len(texts)
+        pending = {}  # {key: (text, [indices])}
+
+        for i, text in enumerate(texts):
+            if self.cache is not None:
+                cached = self.cache.get(keys[i])
+                if cached is not None:
+                    raw[i] = cached
+                    continue
+            pending.setdefault(keys[i], (text, []))[1].append(i)
+
+        unique = sorted(pending, key=lambda k: len(pending[k][0]))
+        results = self.pipe([pending[k][0] for k in unique], batch_size=batch_size) if unique else []
+
+        for key, r in zip(unique, results):
+            for i in pending[key][1]:
+                raw[i] = r
+
+        if self.cache is not None and unique:
+            self.cache.put_many(dict(zip(unique, results)))
+
+        return [self._to_result(r) for r in raw]
+
+    def _to_result(self, result: dict) -> dict:
         return {
             "label": result["label"].lower(),  # positive, negative, neutral
             "score": result["score"],
             "signal": self._get_signal(result)
         }
     
-    def analyze_batch(self, texts: list[str]) -> list[dict]:
-        results = self.pipe(texts, batch_size=16)
-        return [
-            {
-                "label": r["label"].lower(),
-                "score": r["score"],
-                "signal": self._get_signal(r)
-            }
-            for r in results
-        ]
-    
     def _get_signal(self, result: dict) -> str:
         label = result["label"].lower()
         score = result["score"]
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import re
+import sqlite3
+import threading
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SentimentCache:
+    """
+    Content-addressed cache of raw sentiment predictions.
+
+    Entries are keyed by a hash of the model name and the normalized text,
+    so syndicated copies of a story under different URLs share one entry.
+    An in-memory LRU of `max_size` entries sits in front of an optional
+    SQLite store at `path`, which survives restarts.
+
+    Only the model output ({"label", "score"}) is stored; signals are
+    derived by the analyzer so threshold changes apply to cached entries.
+    """
+
+    def __init__(self, max_size: int = 10_000, path: Optional[str] = None):
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment (key TEXT PRIMARY KEY, label TEXT, score REAL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key(text: str, model_name: str) -> str:
+        normalized = _WHITESPACE.sub(" ", text).strip().lower()
+        return hashlib.sha256(f"{model_name}\0{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT label, score FROM sentiment WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    result = {"label": row[0], "score": row[1]}
+                    self._remember(key, result)
+                    self.hits += 1
+                    return result
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: dict):
+        self.put_many({key: result})
+
+    def put_many(self, results: dict):
+        """
+        Store {key: {"label", "score"}} entries, persisting them in one
+        transaction when a store is configured.
+        """
+        with self._lock:
+            for key, result in results.items():
+                self._remember(key, {"label": result["label"], "score": result["score"]})
+
+            if self._db is not None and results:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO sentiment (key, label, score) VALUES (?, ?, ?)",
+                    [(key, r["label"], r["score"]) for key, r in results.items()],
+                )
+                self._db.commit()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, result: dict):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
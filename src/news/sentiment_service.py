@@ -0,0 +1,270 @@
+from concurrent.futures import Future, InvalidStateError
+from typing import Optional
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SENTIMENT_BATCH_SIZE, SENTIMENT_BACKEND
+
+_STOP = None
+_POLL_INTERVAL = 0.5  # seconds between worker liveness checks while waiting
+
+
+def _worker_main(model_name: str, backend: str, num_threads: int, tasks, results):
+    try:
+        # torch is imported here so the parent process never loads it.
+        import torch
+        from news.sentiment import SentimentAnalyzer
+
+        torch.set_num_threads(num_threads)
+        analyzer = SentimentAnalyzer(model_name=model_name, backend=backend)
+    except BaseException as e:
+        # batch_id None reports a startup failure to the collector
+        results.put((None, None, repr(e)))
+        return
+
+    while True:
+        task = tasks.get()
+        if task is _STOP:
+            break
+        batch_id, texts = task
+        try:
+            results.put((batch_id, analyzer.analyze_batch(texts, batch_size=len(texts)), None))
+        except Exception as e:
+            results.put((batch_id, None, repr(e)))
+
+
+def _export_main(model_name: str):
+    from news.sentiment import export_onnx
+
+    export_onnx(model_name)
+
+
+class SentimentService:
+    """
+    Pool of sentiment worker processes with dynamic micro-batching.
+
+    Each worker process loads its own model and runs with an explicit torch
+    thread count. With the onnx backend, the model is exported once (in a
+    helper process, if no export is cached yet) before the workers start,
+    so they all load the same export. Callers submit texts and get Futures back; a dispatcher
+    thread groups queued texts into batches, flushing when `batch_size`
+    texts are waiting or the oldest has waited `max_wait` seconds.
+
+    Exposes analyze/analyze_batch with the same output schema as
+    SentimentAnalyzer, so it can be passed to NewsOrchestrator in its place.
+
+    If a worker fails to start or dies, the service is marked failed: every
+    pending Future gets a RuntimeError and later submits raise, rather than
+    callers waiting forever. Cancelled Futures are dropped from batches.
+    """
+
+    def __init__(self,
+                 num_workers: Optional[int] = None,
+                 threads_per_worker: int = 1,
+                 batch_size: int = SENTIMENT_BATCH_SIZE,
+                 max_wait: float = 0.05,
+                 model_name: str = "ProsusAI/finbert",
+                 backend: str = SENTIMENT_BACKEND):
+        self.num_workers = num_workers or max(1, (os.cpu_count() or 1) // threads_per_worker)
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+
+        ctx = mp.get_context("spawn")
+        if backend == "onnx":
+            # A failed export is reported again by the workers, which retry it.
+            exporter = ctx.Process(target=_export_main, args=(model_name,), daemon=True)
+            exporter.start()
+            exporter.join()
+        self._tasks = ctx.Queue(maxsize=2 * self.num_workers)
+        self._results = ctx.Queue()
+        self._requests = queue.Queue()
+        self._pending = {}  # {batch_id: [Future]}
+        self._pending_lock = threading.Lock()
+        self._batch_ids = itertools.count()
+        self._closed = False
+        self._failure = None  # reason the service stopped working, if it did
+
+        self._workers = [
+            ctx.Process(target=_worker_main,
+                        args=(model_name, backend, threads_per_worker, self._tasks, self._results),
+                        daemon=True)
+            for _ in range(self.num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._collector = threading.Thread(target=self._collect_loop, daemon=True)
+        self._dispatcher.start()
+        self._collector.start()
+
+    def submit(self, text: str) -> Future:
+        if self._closed:
+            raise RuntimeError("SentimentService is closed")
+        if self._failure is not None:
+            raise RuntimeError(f"SentimentService failed: {self._failure}")
+        future = Future()
+        self._requests.put((text, future))
+        return future
+
+    def submit_many(self, texts: list[str]) -> list[Future]:
+        return [self.submit(text) for text in texts]
+
+    def analyze(self, text: str) -> dict:
+        return self.submit(text).result()
+
+    def analyze_batch(self, texts: list[str], batch_size: Optional[int] = None) -> list[dict]:
+        # batch_size is accepted for SentimentAnalyzer compatibility; the
+        # service batches across all callers with its own batch_size.
+        return [future.result() for future in self.submit_many(texts)]
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._requests.put(_STOP)
+        self._dispatcher.join()
+        for worker in self._workers:
+            if worker.is_alive():
+                try:
+                    self._tasks.put(_STOP, timeout=_POLL_INTERVAL)
+                except queue.Full:
+                    break
+        for worker in self._workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+        self._results.put(_STOP)
+        self._collector.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _dispatch_loop(self):
+        stopping = False
+        while not stopping:
+            item = self._requests.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # Futures cancelled while queued are dropped; the rest can no
+            # longer be cancelled, so setting their results is safe.
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            batch_id = next(self._batch_ids)
+            futures = [future for _, future in batch]
+            # Registered under the lock _fail() takes, so a batch is either
+            # failed by _fail() or sees the failure here.
+            with self._pending_lock:
+                failure = self._failure
+                if failure is None:
+                    self._pending[batch_id] = futures
+            if failure is not None:
+                self._fail_futures(futures, failure)
+                continue
+
+            task = (batch_id, [text for text, _ in batch])
+            while True:
+                try:
+                    self._tasks.put(task, timeout=_POLL_INTERVAL)
+                    break
+                except queue.Full:
+                    self._check_workers()
+                    if self._failure is not None:
+                        with self._pending_lock:
+                            futures = self._pending.pop(batch_id, [])
+                        self._fail_futures(futures, self._failure)
+                        break
+
+    def _collect_loop(self):
+        while True:
+            try:
+                message = self._results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                self._check_workers()
+                continue
+            if message is _STOP:
+                break
+
+            try:
+                batch_id, results, error = message
+                if batch_id is None:
+                    self._fail(f"worker failed to start: {error}")
+                    continue
+                with self._pending_lock:
+                    futures = self._pending.pop(batch_id, [])
+                if error is not None:
+                    self._fail_futures(futures, f"Sentiment worker failed: {error}")
+                else:
+                    for future, result in zip(futures, results):
+                        if not future.done():
+                            future.set_result(result)
+            except Exception as e:
+                # never let one bad message stop result delivery
+                print(f"SentimentService collector error: {e!r}")
+
+    def _check_workers(self):
+        if self._closed or self._failure is not None:
+            return
+        dead = [w for w in self._workers if not w.is_alive()]
+        if dead:
+            self._fail(f"worker exited with code {dead[0].exitcode}")
+
+    def _fail(self, reason: str):
+        """Mark the service failed and fail every pending Future."""
+        with self._pending_lock:
+            if self._failure is None:
+                self._failure = reason
+            futures = [future for batch in self._pending.values() for future in batch]
+            self._pending.clear()
+        self._fail_futures(futures, self._failure)
+
+    @staticmethod
+    def _fail_futures(futures: list[Future], reason: str):
+        for future in futures:
+            try:
+                future.set_exception(RuntimeError(reason))
+            except InvalidStateError:
+                pass
+
+
+if __name__ == "__main__":
+    texts = [
+        "The company's stock price soared after the successful product launch.",
+        "Market uncertainty is causing investors to be cautious.",
+    ] * 64
+
+    with SentimentService(threads_per_worker=1) as service:
+        start_time = time.time()
+        results = service.analyze_batch(texts)
+        print(f"Scored {len(results)} texts on {service.num_workers} workers "
+              f"in {time.time() - start_time:.2f} seconds")
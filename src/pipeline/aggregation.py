@@ -0,0 +1,258 @@
+from collections import deque
+from typing import Optional, Union
+import heapq
+import math
+import threading
+import time
+
+RELEVANCE_WEIGHTS = {"high": 1.0, "medium": 0.5, "low": 0.25}
+IMPACT_SIGNS = {"positive": 1.0, "negative": -1.0, "neutral": 0.0}
+WINDOWS = {"1h": 3600, "1d": 24 * 3600, "1w": 7 * 24 * 3600}
+
+_MAX_EXPONENT = 300.0  # rebase before exp(rate * (t - ref)) can overflow
+
+
+class _TickerState:
+    __slots__ = ("sentiment", "activity", "positive", "negative", "windows")
+
+    def __init__(self, n_windows: int):
+        self.sentiment = 0.0  # decayed sums, scaled to the reference time
+        self.activity = 0.0
+        self.positive = 0    # lifetime mention counts
+        self.negative = 0
+        self.windows = [[0.0, 0.0, 0] for _ in range(n_windows)]  # [sentiment, activity, mentions]
+
+
+class TickerSentimentAggregator:
+    """
+    Per-ticker sentiment, exponentially decayed and over sliding windows.
+
+    Each mention adds weight = model score x relevance weight to the
+    ticker's activity, and sign(impact) x weight to its sentiment.
+
+    Decayed sums use a reference-time trick: a mention at time t is stored
+    as weight * exp(rate * (t - ref)), so nothing has to be decayed on
+    update, and the value at any time `now` is the stored sum times
+    exp(-rate * (now - ref)). When the exponent grows large, every stored
+    sum is rescaled once to a new reference time.
+
+    Because every ticker decays by the same factor, ranking by stored
+    activity is ranking by decayed activity at any time. Stored values only
+    grow, so the top-K set is kept exact by updating only the ticker that
+    received a mention. Reading it costs O(K log K) rather than a sort over
+    every ticker.
+
+    Window sums (default 1h/1d/1w) are kept with one deque of events per
+    window. Expired events are subtracted from the front. Timestamps are
+    clamped to be non-decreasing so the deques stay in time order.
+
+    Public methods are thread-safe, so one thread can update while another
+    reads the ranking.
+    """
+
+    def __init__(self,
+                 half_life: float = 6 * 3600,
+                 top_k: int = 10,
+                 windows: Optional[dict] = None):
+        """
+        Args:
+            half_life: Seconds for a mention's decayed weight to halve
+            top_k: Size of the incrementally maintained ranking
+            windows: {name: seconds} sliding windows, defaults to WINDOWS
+        """
+        self.rate = math.log(2) / half_life
+        self.top_k = top_k
+        self.window_names = list(windows or WINDOWS)
+        self.window_lengths = [(windows or WINDOWS)[name] for name in self.window_names]
+
+        self.states = {}
+        self._events = [deque() for _ in self.window_names]  # (t, ticker, sentiment, activity)
+        self._ref = None
+        self._last = None
+        self._top = {}    # {ticker: scaled activity} of the current top-K
+        self._heap = []   # (scaled activity, ticker) for _top, may hold stale entries
+        self._lock = threading.Lock()
+
+    def update(self,
+               ticker: str,
+               impact: str,
+               score: float,
+               relevance: Union[str, float] = 1.0,
+               timestamp: Optional[float] = None):
+        """
+        Record one mention.
+
+        Args:
+            ticker: Ticker symbol
+            impact: "positive", "negative" or "neutral"
+            score: Model confidence for the article
+            relevance: "high"/"medium"/"low" or a numeric weight
+            timestamp: Unix time of the mention, defaults to now
+        """
+        weight = score * (RELEVANCE_WEIGHTS.get(relevance, 0.0) if isinstance(relevance, str) else relevance)
+        sign = IMPACT_SIGNS.get(impact, 0.0)
+
+        with self._lock:
+            t = self._advance(timestamp)
+            state = self.states.get(ticker)
+            if state is None:
+                state = self.states[ticker] = _TickerState(len(self.window_names))
+
+            scale = math.exp(self.rate * (t - self._ref))
+            state.sentiment += sign * weight * scale
+            state.activity += weight * scale
+            if impact == "positive":
+                state.positive += 1
+            elif impact == "negative":
+                state.negative += 1
+
+            for window, events in zip(state.windows, self._events):
+                window[0] += sign * weight
+                window[1] += weight
+                window[2] += 1
+                events.append((t, ticker, sign * weight, weight))
+
+            self._rank(ticker, state.activity)
+
+    def add_article(self, ticker_impacts: list, score: float, timestamp: Optional[float] = None):
+        """
+        Record every ticker of one article.
+
+        Args:
+            ticker_impacts: TickerImpact-like objects with ticker, impact
+                and relevance attributes
+            score: The article's sentiment score
+        """
+        for t in ticker_impacts:
+            self.update(t.ticker, t.impact, score, t.relevance, timestamp)
+
+    def decayed(self, ticker: str, now: Optional[float] = None) -> tuple[float, float]:
+        """
+        Returns:
+            Tuple (sentiment, activity) decayed to `now`.
+        """
+        with self._lock:
+            state = self.states.get(ticker)
+            if state is None:
+                return 0.0, 0.0
+            factor = self._decay(now)
+            return state.sentiment * factor, state.activity * factor
+
+    def window(self, ticker: str, name: str, now: Optional[float] = None) -> tuple[float, float, int]:
+        """
+        Returns:
+            Tuple (sentiment, activity, mentions) over window `name`.
+        """
+        with self._lock:
+            self._expire(time.time() if now is None else max(now, self._last or now))
+            state = self.states.get(ticker)
+            if state is None:
+                return 0.0, 0.0, 0
+            sentiment, activity, mentions = state.windows[self.window_names.index(name)]
+            return sentiment, activity, mentions
+
+    def top(self, n: Optional[int] = None, now: Optional[float] = None) -> list[dict]:
+        """
+        The n (default top_k) tickers with the highest decayed activity.
+        Asking for more than top_k falls back to sorting every ticker.
+        """
+        n = self.top_k if n is None else n
+        with self._lock:
+            if n <= self.top_k:
+                ranked = sorted(self._top.items(), key=lambda item: item[1], reverse=True)[:n]
+            else:
+                ranked = heapq.nlargest(n, ((ticker, s.activity) for ticker, s in self.states.items()),
+                                        key=lambda item: item[1])
+
+            now = time.time() if now is None else max(now, self._last or now)
+            self._expire(now)
+            factor = self._decay(now)
+            return [self._summary(ticker, factor) for ticker, _ in ranked]
+
+    def counts(self) -> dict:
+        """Lifetime {ticker: {"positive": count, "negative": count}}."""
+        with self._lock:
+            return {ticker: {"positive": s.positive, "negative": s.negative} for ticker, s in self.states.items()}
+
+    def _summary(self, ticker: str, factor: float) -> dict:
+        state = self.states[ticker]
+        net_sentiment = state.positive - state.negative
+        summary = {
+            "ticker": ticker,
+            "total_mentions": state.positive + state.negative,
+            "positive_mentions": state.positive,
+            "negative_mentions": state.negative,
+            "net_sentiment": net_sentiment,
+            "sentiment_label": "bullish" if net_sentiment > 0 else "bearish" if net_sentiment < 0 else "neutral",
+            "decayed_sentiment": state.sentiment * factor,
+            "decayed_activity": state.activity * factor,
+        }
+        for name, (sentiment, activity, mentions) in zip(self.window_names, state.windows):
+            summary[f"sentiment_{name}"] = sentiment
+            summary[f"mentions_{name}"] = mentions
+        return summary
+
+    def _advance(self, timestamp: Optional[float]) -> float:
+        t = time.time() if timestamp is None else timestamp
+        if self._last is not None:
+            t = max(t, self._last)
+        self._last = t
+
+        if self._ref is None:
+            self._ref = t
+        elif self.rate * (t - self._ref) > _MAX_EXPONENT:
+            self._rebase(t)
+        self._expire(t)
+        return t
+
+    def _rebase(self, t: float):
+        factor = math.exp(-self.rate * (t - self._ref))
+        for state in self.states.values():
+            state.sentiment *= factor
+            state.activity *= factor
+        self._top = {ticker: activity * factor for ticker, activity in self._top.items()}
+        self._heap = [(activity, ticker) for ticker, activity in self._top.items()]
+        heapq.heapify(self._heap)
+        self._ref = t
+
+    def _decay(self, now: Optional[float]) -> float:
+        if self._ref is None:
+            return 1.0
+        now = time.time() if now is None else now
+        return math.exp(-self.rate * (now - self._ref))
+
+    def _expire(self, now: float):
+        for k, (length, events) in enumerate(zip(self.window_lengths, self._events)):
+            cutoff = now - length
+            while events and events[0][0] <= cutoff:
+                _, ticker, sentiment, activity = events.popleft()
+                window = self.states[ticker].windows[k]
+                window[2] -= 1
+                if window[2] == 0:
+                    window[0] = window[1] = 0.0  # reset instead of accumulating rounding error
+                else:
+                    window[0] -= sentiment
+                    window[1] -= activity
+
+    def _rank(self, ticker: str, activity: float):
+        if self.top_k <= 0:
+            return
+        if ticker in self._top:
+            self._top[ticker] = activity
+        elif len(self._top) < self.top_k:
+            self._top[ticker] = activity
+        else:
+            # Pop stale heap entries (older values of tickers still in the top).
+            while self._heap and self._top.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            lowest, lowest_ticker = self._heap[0]
+            if activity <= lowest:
+                return
+            heapq.heappop(self._heap)
+            del self._top[lowest_ticker]
+            self._top[ticker] = activity
+
+        heapq.heappush(self._heap, (activity, ticker))
+        if len(self._heap) > 4 * self.top_k:
+            self._heap = [(a, t) for t, a in self._top.items()]
+            heapq.heapify(self._heap)
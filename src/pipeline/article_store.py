@@ -0,0 +1,166 @@
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, Optional, Union
+import json
+import sqlite3
+import threading
+
+TimeLike = Union[str, date, datetime]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,  -- published time, or processing time if unknown (UTC ISO 8601)
+    processed_at TEXT NOT NULL,
+    url TEXT,
+    signal TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_timestamp ON articles (timestamp);
+CREATE TABLE IF NOT EXISTS article_tickers (
+    article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE,
+    ticker TEXT NOT NULL,
+    PRIMARY KEY (ticker, article_id)
+) WITHOUT ROWID;
+"""
+
+
+def _timestamp(value: TimeLike) -> str:
+    """
+    Normalize a datetime, date or ISO 8601 string (e.g. NewsAPI's
+    "2024-05-01T13:00:00Z") to a UTC "YYYY-MM-DDTHH:MM:SS+00:00" string,
+    which sorts chronologically as text. Naive values are taken as UTC.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+class ArticleStore:
+    """
+    Append-only store of processed article records in SQLite (WAL mode).
+
+    append() writes one cycle's records in a single transaction, so a crash
+    leaves either all or none of them and earlier cycles are never
+    rewritten. Records are kept as JSON next to an index on their time and
+    a ticker table, and iter_articles() streams them back lazily, filtered
+    by time range and/or ticker, on its own read connection so reading
+    never blocks the writer.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    def append(self, records: list[dict]) -> int:
+        """
+        Args:
+            records: Article records as built by the orchestrator; "tickers"
+                is indexed, "published_at" (if present and parseable) sets
+                the record time, otherwise the processing time is used
+
+        Returns:
+            Number of records written.
+        """
+        if not records:
+            return 0
+
+        processed_at = _timestamp(datetime.now(timezone.utc))
+        with self._lock, self._db:
+            for record in records:
+                try:
+                    timestamp = _timestamp(record["published_at"])
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    timestamp = processed_at
+                cursor = self._db.execute(
+                    "INSERT INTO articles (timestamp, processed_at, url, signal, record) VALUES (?, ?, ?, ?, ?)",
+                    (timestamp, processed_at,
+                     record.get("url"), record.get("signal"), json.dumps(record)),
+                )
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO article_tickers (article_id, ticker) VALUES (?, ?)",
+                    [(cursor.lastrowid, ticker) for ticker in record.get("tickers", [])],
+                )
+        return len(records)
+
+    def iter_articles(self,
+                      start: Optional[TimeLike] = None,
+                      end: Optional[TimeLike] = None,
+                      ticker: Optional[str] = None,
+                      fetch_size: int = 500) -> Iterator[dict]:
+        """
+        Lazily yield records in time order.
+
+        Args:
+            start: Earliest record time (inclusive)
+            end: Latest record time (exclusive); a date means its midnight
+            ticker: Only records mentioning this ticker
+            fetch_size: Rows read from SQLite per round trip
+        """
+        query = "SELECT a.record FROM articles a"
+        clauses, params = [], []
+        if ticker is not None:
+            query += " JOIN article_tickers t ON t.article_id = a.id"
+            clauses.append("t.ticker = ?")
+            params.append(ticker)
+        if start is not None:
+            clauses.append("a.timestamp >= ?")
+            params.append(_timestamp(start))
+        if end is not None:
+            clauses.append("a.timestamp < ?")
+            params.append(_timestamp(end))
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY a.timestamp, a.id"
+
+        reader = sqlite3.connect(self.path)
+        try:
+            cursor = reader.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                for (record,) in rows:
+                    yield json.loads(record)
+        finally:
+            reader.close()
+
+    def iter_day(self, day: date, ticker: Optional[str] = None) -> Iterator[dict]:
+        return self.iter_articles(start=day, end=day + timedelta(days=1), ticker=ticker)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def compact(self, retain_days: Optional[int] = None) -> int:
+        """
+        Drop records older than `retain_days` (if given), then checkpoint
+        the WAL into the main file and reclaim free pages.
+
+        Returns:
+            Number of records removed.
+        """
+        removed = 0
+        with self._lock:
+            if retain_days is not None:
+                cutoff = _timestamp(datetime.now(timezone.utc) - timedelta(days=retain_days))
+                with self._db:
+                    removed = self._db.execute("DELETE FROM articles WHERE timestamp < ?", (cutoff,)).rowcount
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._db.execute("VACUUM")
+        return removed
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
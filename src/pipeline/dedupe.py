@@ -0,0 +1,282 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+
+from .matcher import TOKEN_PATTERN
+
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid", "guccounter"}
+MIN_TITLE_TOKENS = 4  # shorter titles ("Stocks rise") are too generic to fingerprint
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL: lowercase scheme and host without
+    "www.", no fragment, no tracking parameters (utm_*, fbclid, ...), sorted
+    remaining parameters and no trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def title_fingerprint(title: str) -> Optional[str]:
+    """
+    Hash of a headline's lowercase alphanumeric tokens, with NewsAPI's
+    trailing " - Source" removed, so syndicated copies of a story under
+    different URLs share a fingerprint. None for titles too short or
+    generic to identify a story.
+    """
+    if not title or title == "[Removed]":
+        return None
+    head, sep, _ = title.rpartition(" - ")
+    tokens = TOKEN_PATTERN.findall((head if sep else title).lower())
+    if len(tokens) < MIN_TITLE_TOKENS:
+        return None
+    return hashlib.sha1(" ".join(tokens).encode("utf-8")).hexdigest()[:16]
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized for `capacity` keys at `error_rate` false
+    positives. Bits live in a bytearray, and k positions per key come from
+    double hashing one blake2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.n_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.n_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.n_bits for i in range(self.n_hashes)]
+
+    def add(self, key: str):
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+
+class DedupeIndex:
+    """
+    Remembers which stories have been processed.
+
+    Each article is keyed on its normalized URL and, when the title is
+    specific enough, a title fingerprint, so tracking-parameter variants
+    and syndicated copies are caught. Keys live in an insertion-ordered
+    dict, with the oldest entry first: entries older than `ttl` seconds or
+    beyond `max_size` are evicted from the front in O(1), and a key seen
+    again moves to the back with a fresh timestamp.
+
+    With `bloom_capacity`, keys evicted for space (beyond `max_size`, not
+    by the TTL) are still remembered approximately by a Bloom filter,
+    which is cleared once it has taken `bloom_capacity` keys to keep its
+    error bounded. Each of an article's (up to two) keys can be a false
+    positive, so up to about twice `bloom_error_rate` of genuinely new
+    articles are dropped as duplicates once the filter is full.
+
+    With `path`, state is kept in SQLite (WAL) and reloaded on start;
+    flush() writes only the changes since the last flush. To persist keys
+    only once the articles behind them are safely stored elsewhere, detach
+    the changes with checkpoint() and pass them to flush() later.
+    """
+
+    def __init__(self,
+                 max_size: int = 50_000,
+                 ttl: Optional[float] = 7 * 24 * 3600,
+                 path: Optional[str] = None,
+                 bloom_capacity: Optional[int] = None,
+                 bloom_error_rate: float = 1e-4):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.bloom = BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None
+        self.duplicates = 0
+        self._entries = OrderedDict()  # {key: last seen (unix time)}
+        self._dirty = {}
+        self._removed = set()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, seen_at REAL)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS bloom (id INTEGER PRIMARY KEY, count INTEGER, bits BLOB)")
+            self._db.commit()
+            self._load()
+
+    @staticmethod
+    def keys(url: Optional[str], title: Optional[str]) -> list[str]:
+        keys = []
+        if url:
+            keys.append("u:" + normalize_url(url))
+        fingerprint = title_fingerprint(title or "")
+        if fingerprint:
+            keys.append("t:" + fingerprint)
+        return keys
+
+    def seen(self, url: Optional[str] = None, title: Optional[str] = None) -> bool:
+        with self._lock:
+            self._expire(time.time())
+            return self._seen(self.keys(url, title))
+
+    def add(self, article: dict) -> bool:
+        """
+        Record an article (NewsAPI shape: "url", "title").
+
+        Returns:
+            True if it is new, False if its URL or title was already seen.
+            Articles with neither are always new.
+        """
+        keys = self.keys(article.get("url"), article.get("title"))
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            duplicate = self._seen(keys)
+            # Remember every key, so later copies match either this URL or
+            # the original's.
+            for key in keys:
+                self._remember(key, now)
+            if duplicate:
+                self.duplicates += 1
+            return not duplicate
+
+    def checkpoint(self) -> tuple:
+        """
+        Detach the changes since the last checkpoint or flush, without
+        writing them. Changes that are never passed to flush() are not
+        persisted, so those keys are forgotten on restart.
+
+        Returns:
+            Opaque changes for flush() or discard().
+        """
+        with self._lock:
+            persist_bloom = self._db is not None and self.bloom is not None and self._dirty
+            bloom = (self.bloom.count, bytes(self.bloom.bits)) if persist_bloom else None
+            changes = (self._dirty, self._removed, bloom)
+            self._dirty, self._removed = {}, set()
+        return changes
+
+    def discard(self, changes: tuple, later: Iterable[tuple] = ()):
+        """
+        Forget the keys recorded in a checkpoint, so their articles count
+        as new again (e.g. when storing them failed).
+
+        Args:
+            changes: The checkpoint to forget
+            later: Checkpoints taken since and not flushed yet; the keys
+                are dropped from them too, so flushing them cannot persist
+                keys that were only seen again as duplicates
+        """
+        with self._lock:
+            for key in changes[0]:
+                self._entries.pop(key, None)
+                self._dirty.pop(key, None)
+                for dirty, _, _ in later:
+                    dirty.pop(key, None)
+
+    def flush(self, changes: Optional[tuple] = None):
+        """
+        Persist changes in one transaction: those returned by checkpoint(),
+        or by default everything since the last checkpoint or flush.
+        Checkpoints must be flushed in the order they were taken.
+        """
+        if self._db is None:
+            return
+        if changes is None:
+            changes = self.checkpoint()
+        dirty, removed, bloom = changes
+        with self._lock, self._db:
+            if removed:
+                self._db.executemany("DELETE FROM seen WHERE key = ?", [(k,) for k in removed])
+            if dirty:
+                self._db.executemany("INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)", list(dirty.items()))
+            if bloom is not None:
+                self._db.execute("INSERT OR REPLACE INTO bloom (id, count, bits) VALUES (0, ?, ?)", bloom)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "duplicates": self.duplicates,
+            "bloom_keys": self.bloom.count if self.bloom is not None else None,
+        }
+
+    def close(self):
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _seen(self, keys: list[str]) -> bool:
+        return any(key in self._entries or (self.bloom is not None and key in self.bloom) for key in keys)
+
+    def _remember(self, key: str, now: float):
+        self._entries[key] = now
+        self._entries.move_to_end(key)
+        self._dirty[key] = now
+        while len(self._entries) > self.max_size:
+            key = self._evict()
+            if self.bloom is not None:
+                if self.bloom.count >= self.bloom.capacity:
+                    self.bloom.clear()
+                self.bloom.add(key)
+
+    def _expire(self, now: float):
+        if self.ttl is None:
+            return
+        cutoff = now - self.ttl
+        while self._entries and next(iter(self._entries.values())) < cutoff:
+            self._evict()
+
+    def _evict(self) -> str:
+        key, _ = self._entries.popitem(last=False)
+        self._dirty.pop(key, None)
+        self._removed.add(key)
+        return key
+
+    def _load(self):
+        cutoff = time.time() - self.ttl if self.ttl is not None else float("-inf")
+        with self._db:
+            self._db.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,))
+        rows = self._db.execute(
+            "SELECT key, seen_at FROM seen ORDER BY seen_at DESC LIMIT ?", (self.max_size,)
+        ).fetchall()
+        for key, seen_at in reversed(rows):
+            self._entries[key] = seen_at
+        if len(rows) == self.max_size:
+            with self._db:
+                self._db.execute("DELETE FROM seen WHERE seen_at < ?", (rows[-1][1],))
+
+        if self.bloom is not None:
+            row = self._db.execute("SELECT count, bits FROM bloom WHERE id = 0").fetchone()
+            if row is not None and len(row[1]) == len(self.bloom.bits):
+                self.bloom.count, self.bloom.bits = row[0], bytearray(row[1])
@@ -0,0 +1,53 @@
+import re
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_TICKER = "\0ticker"  # node key holding the ticker of a complete name
+
+
+class CompanyMatcher:
+    """
+    Finds every company name from a {name: ticker} mapping in one scan.
+
+    Names and text are split into lowercase alphanumeric tokens, and names
+    are stored in a trie keyed by token. Matching walks the trie from each
+    token of the text; a walk stops at the first token with no child, so
+    the scan is linear in the text for a fixed longest name, independent of
+    how many names are loaded.
+
+    Because matching happens on whole tokens, "meta" does not match inside
+    "metadata" and "intel" does not match inside "intelligence".
+    Punctuation and spacing inside names are ignored, so "coca-cola" and
+    "coca cola" are the same name.
+    """
+
+    def __init__(self, mappings: dict):
+        self.root = {}
+
+        for name, ticker in mappings.items():
+            tokens = TOKEN_PATTERN.findall(name.lower())
+            if not tokens:
+                continue
+            node = self.root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_TICKER] = ticker
+
+    def find(self, text: str) -> set[str]:
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        root = self.root
+        tickers = set()
+
+        for i, token in enumerate(tokens):
+            node = root.get(token)
+            j = i + 1
+            while node is not None:
+                ticker = node.get(_TICKER)
+                if ticker is not None:
+                    tickers.add(ticker)
+                if j == len(tokens):
+                    break
+                node = node.get(tokens[j])
+                j += 1
+
+        return tickers
@@ -1,117 +1,251 @@
 
-import json
+import threading
+import time
+from datetime import date
 from pathlib import Path
+from typing import Optional
 import sys
 
+import requests
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from config.settings import AGGREGATION_HALF_LIFE, AGGREGATION_TOP_K, ARTICLE_RETENTION_DAYS, ARTICLE_STORE_PATH, DEDUPE_BLOOM_CAPACITY, DEDUPE_BLOOM_ERROR_RATE, DEDUPE_MAX_SIZE, DEDUPE_PATH, DEDUPE_TTL, NEWS_POLL_INTERVAL, NEWS_STREAMS, PIPELINE_QUEUE_SIZE, SENTIMENT_BATCH_SIZE, SENTIMENT_CACHE_SIZE, SENTIMENT_CACHE_PATH
 from news.fetch_news import NewsAPI
 from news.sentiment import SentimentAnalyzer
+from news.sentiment_cache import SentimentCache
+from pipeline.aggregation import TickerSentimentAggregator
+from pipeline.article_store import ArticleStore
+from pipeline.dedupe import DedupeIndex
+from pipeline.streaming import CycleEnd, Pipeline, Stage
 from pipeline.tickers import get_tickers_sentiment, TickerExtractor
 
 class NewsOrchestrator:
-    def __init__(self):
-        self.news_api = NewsAPI()
-        self.sentiment_analyzer = SentimentAnalyzer()
+    def __init__(self, batch_size: int = SENTIMENT_BATCH_SIZE, sentiment_analyzer=None,
+                 streams: list[dict] = NEWS_STREAMS, news_api=None, queue_size: int = PIPELINE_QUEUE_SIZE,
+                 article_store: Optional[ArticleStore] = None, dedupe_index: Optional[DedupeIndex] = None):
+        """
+        Args:
+            batch_size: Texts per inference batch
+            sentiment_analyzer: Anything with SentimentAnalyzer's
+                analyze_batch, e.g. a SentimentService worker pool. Defaults
+                to an in-process cached SentimentAnalyzer.
+            streams: NewsAPI query streams fetched each cycle
+            news_api: NewsAPI client, e.g. one pointed at a stub server
+            queue_size: Capacity of each queue between pipeline stages
+            article_store: Where processed articles are appended; defaults
+                to the SQLite store at ARTICLE_STORE_PATH
+            dedupe_index: Remembers processed stories across cycles and
+                restarts; defaults to one persisted at DEDUPE_PATH
+        """
+        self.batch_size = batch_size
+        self.streams = streams
+        self.queue_size = queue_size
+        self.pipeline = None
+        self._cycle_new = 0
+        self.news_api = news_api or NewsAPI()
+        self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer(
+            cache=SentimentCache(max_size=SENTIMENT_CACHE_SIZE, path=SENTIMENT_CACHE_PATH)
+        )
         self.ticker_extractor = TickerExtractor()
-        self.processed_urls = set() # Keep to set for uniqueness
-        self.bullish_articles = set()
-        self.bearish_articles = set()
-        self.all_articles = list()
-        self.ticker_impacts = {}  # {ticker: {"positive": count, "negative": count}}
+        if dedupe_index is None:
+            dedupe_index = DedupeIndex(
+                max_size=DEDUPE_MAX_SIZE, ttl=DEDUPE_TTL, path=DEDUPE_PATH,
+                bloom_capacity=DEDUPE_BLOOM_CAPACITY, bloom_error_rate=DEDUPE_BLOOM_ERROR_RATE
+            )
+        self.dedupe_index = dedupe_index
+        self._unsaved_keys = {}  # {cycle: dedupe changes}, persisted once the cycle is stored
+        self.bullish_count = 0
+        self.bearish_count = 0
+        self.article_store = article_store or ArticleStore(ARTICLE_STORE_PATH)
+        self._cycle_records = []  # records of the current cycle, written at its end
+        self._compacted_on = date.today()
+        self.aggregator = TickerSentimentAggregator(half_life=AGGREGATION_HALF_LIFE, top_k=AGGREGATION_TOP_K)
 
     def get_num_bullish_articles(self):
-        return len(self.bullish_articles)
+        return self.bullish_count
     
     def get_num_bearish_articles(self):
-        return len(self.bearish_articles)
+        return self.bearish_count
 
     def get_ticker_summary(self) -> dict:
-        return self.ticker_impacts
+        """Lifetime {ticker: {"positive": count, "negative": count}}."""
+        return self.aggregator.counts()
     
     def get_most_affected_tickers(self, top_n: int = 10) -> list[dict]:
-        ticker_list = []
-        for ticker, impacts in self.ticker_impacts.items():
-            total = impacts["positive"] + impacts["negative"]
-            net_sentiment = impacts["positive"] - impacts["negative"]
-            ticker_list.append({
-                "ticker": ticker,
-                "total_mentions": total,
-                "positive_mentions": impacts["positive"],
-                "negative_mentions": impacts["negative"],
-                "net_sentiment": net_sentiment,
-                "sentiment_label": "bullish" if net_sentiment > 0 else "bearish" if net_sentiment < 0 else "neutral"
-            })
-        
-        # Sort by total mentions descending
-        ticker_list.sort(key=lambda x: x["total_mentions"], reverse=True)
-        return ticker_list[:top_n]
+        """
+        Tickers with the highest time-decayed, relevance-weighted activity,
+        read from the aggregator's incrementally maintained top-K. Besides
+        the lifetime mention counts, entries carry decayed sentiment and
+        1h/1d/1w window sums.
+        """
+        return self.aggregator.top(top_n)
 
     def run_cycle(self):
-        articles = self.news_api.fetch_news(page_size=100)
+        """Fetch and process one cycle through the streaming stages."""
+        self.run_service(max_cycles=1)
 
-        news_articles = [
-            a for a in articles if a.get("url") not in self.processed_urls
-        ]
+    def run_service(self,
+                    interval: float = NEWS_POLL_INTERVAL,
+                    max_cycles: Optional[int] = None,
+                    stop_event: Optional[threading.Event] = None):
+        """
+        Long-lived mode: fetch every `interval` seconds and stream articles
+        through dedupe -> sentiment -> ticker attribution -> aggregation ->
+        sink, each stage on its own thread behind a bounded queue. Fetching
+        the next page overlaps inference on the previous ones, and full
+        queues block the fetcher, so memory stays flat however much is
+        fetched.
 
-        for article in news_articles:
-            self.processed_urls.add(article.get("url"))
-            self._process_article(article)
+        Args:
+            interval: Seconds between the starts of consecutive fetches
+            max_cycles: Stop after this many cycles (None runs until
+                stop_event is set or KeyboardInterrupt)
+            stop_event: Set it from another thread to stop after the
+                current cycle has drained
+        """
+        stop_event = stop_event or threading.Event()
+        self.pipeline = self._build_pipeline()
+        self.pipeline.start()
 
-        # clear processed URLs to avoid memory bloat
-        if len(self.processed_urls) > 500:
-            self.processed_urls = set(list(self.processed_urls)[-500:])
+        cycle = 0
+        try:
+            while max_cycles is None or cycle < max_cycles:
+                cycle += 1
+                marker = CycleEnd(cycle)
+                try:
+                    for article in self.news_api.iter_many(self.streams):
+                        marker.fetched += 1
+                        self.pipeline.put(article)
+                except requests.RequestException as e:
+                    print(f"Fetch failed in cycle {cycle}: {e}")
+                self.pipeline.put(marker)
 
-        output_path = Path(__file__).parent.parent / "data" / "daily_news.json"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, "w") as f:
-            json.dump(self.all_articles, f, indent=4)
+                if max_cycles is not None and cycle >= max_cycles:
+                    break
+                if stop_event.wait(max(interval - (time.monotonic() - marker.started), 0.0)):
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.pipeline.close()
 
-        print("Cycle complete. Processed articles:", len(news_articles))
-        print("Number of Bullish articles:", self.get_num_bullish_articles())
-        print("Number of Bearish articles:", self.get_num_bearish_articles())
-        
-        most_affected = self.get_most_affected_tickers(top_n=5)
-        if most_affected:
-            print("\nTop Affected Tickers:")
-            for t in most_affected:
-                print(f"  {t['ticker']}: {t['total_mentions']} mentions "
-                      f"(+{t['positive_mentions']}/-{t['negative_mentions']}) -> {t['sentiment_label']}")
+    def stage_metrics(self) -> dict:
+        """Per-stage throughput and queue depth of the running pipeline."""
+        return self.pipeline.metrics() if self.pipeline is not None else {}
 
-    def _process_article(self, article: dict):
-        title = article.get("title", "")
-        description = article.get("description", "")
-        content = f"{title}. {description}"
+    def _build_pipeline(self) -> Pipeline:
+        size = self.queue_size
+        return Pipeline([
+            Stage("dedupe", self._dedupe, maxsize=size, on_marker=self._end_dedupe_cycle),
+            Stage("sentiment", self._score, maxsize=size, batch_size=self.batch_size,
+                  on_marker=self._end_sentiment_cycle),
+            Stage("tickers", self._attribute, maxsize=size),
+            Stage("aggregate", self._aggregate, maxsize=size, on_marker=self._end_aggregate_cycle),
+            Stage("sink", self._sink, maxsize=size, on_marker=self._end_cycle),
+        ])
 
-        sentiment_result = self.sentiment_analyzer.analyze(content)
-        
+    def _dedupe(self, article: dict):
+        if self.dedupe_index.add(article):
+            self._cycle_new += 1
+            yield article
+
+    def _end_dedupe_cycle(self, marker: CycleEnd):
+        marker.new = self._cycle_new
+        self._cycle_new = 0
+        self._unsaved_keys[marker.cycle] = self.dedupe_index.checkpoint()
+        marker.summary["dedupe"] = self.dedupe_index.stats()
+
+    def _score(self, articles: list[dict]):
+        # One batched inference call per micro-batch instead of one forward
+        # pass per article.
+        texts = [self._article_text(article) for article in articles]
+        return zip(articles, self.sentiment_analyzer.analyze_batch(texts, batch_size=self.batch_size))
+
+    def _end_sentiment_cycle(self, marker: CycleEnd):
+        cache = getattr(self.sentiment_analyzer, "cache", None)
+        if cache is not None:
+            marker.summary["cache"] = cache.stats()
+
+    def _attribute(self, item: tuple):
+        article, sentiment_result = item
         ticker_info = get_tickers_sentiment(
-            title=title,
-            description=description,
+            title=article.get("title", ""),
+            description=article.get("description", ""),
             sentiment_result=sentiment_result,
             extractor=self.ticker_extractor
         )
+        yield article, sentiment_result, ticker_info
+
+    def _end_aggregate_cycle(self, marker: CycleEnd):
+        # Taken here, on the thread that updates these counts, while the
+        # next cycle's articles are still queued behind the marker.
+        marker.summary["bullish"] = self.get_num_bullish_articles()
+        marker.summary["bearish"] = self.get_num_bearish_articles()
+        marker.summary["top_tickers"] = self.get_most_affected_tickers(top_n=5)
+
+    def _sink(self, record: dict):
+        self._cycle_records.append(record)
+
+    def _end_cycle(self, marker: CycleEnd):
+        # Only this cycle's records are written, in one transaction. Their
+        # dedupe keys are persisted only after that commits; if it fails,
+        # they are forgotten, so the articles count as new when fetched again.
+        keys = self._unsaved_keys.pop(marker.cycle)
+        try:
+            stored = self.article_store.append(self._cycle_records)
+        except Exception:
+            self.dedupe_index.discard(keys, later=list(self._unsaved_keys.values()))
+            raise
+        finally:
+            self._cycle_records = []  # a failed write must not hold records over into later cycles
+        self.dedupe_index.flush(keys)
+        if date.today() != self._compacted_on:
+            self.article_store.compact(retain_days=ARTICLE_RETENTION_DAYS)
+            self._compacted_on = date.today()
+
+        print(f"Cycle {marker.cycle} complete in {time.monotonic() - marker.started:.2f}s. "
+              f"Fetched: {marker.fetched}, processed articles: {marker.new}, stored: {stored}")
+        summary = marker.summary
+        print("Number of Bullish articles:", summary.get("bullish", 0))
+        print("Number of Bearish articles:", summary.get("bearish", 0))
+        if "cache" in summary:
+            print("Sentiment cache:", summary["cache"])
+        print("Dedupe index:", summary.get("dedupe"))
+
+        most_affected = summary.get("top_tickers")
+        if most_affected:
+            print("\nTop Affected Tickers:")
+            for t in most_affected:
+                print(f"  {t['ticker']}: {t['total_mentions']} mentions "
+                      f"(+{t['positive_mentions']}/-{t['negative_mentions']}) -> {t['sentiment_label']}, "
+                      f"decayed sentiment {t['decayed_sentiment']:+.2f}, {t['mentions_1h']} in the last hour")
+
+        print("\nStage metrics:")
+        for name, m in self.stage_metrics().items():
+            print(f"  {name:<10} {m['processed']:>7} items  {m['throughput']:8.1f}/s  "
+                  f"capacity {m['capacity']:8.1f}/s  queue {m['queue_depth']}/{m['max_queue_depth']} (now/max)  "
+                  f"errors {m['errors']}")
+
+    @staticmethod
+    def _article_text(article: dict) -> str:
+        return f"{article.get('title', '')}. {article.get('description', '')}"
+
+    def _aggregate(self, item: tuple):
+        article, sentiment_result, ticker_info = item
+        title = article.get("title", "")
 
         if sentiment_result["signal"] == "NEUTRAL":
             return  # Skip neutral articles
         
         elif sentiment_result["signal"] == "BULLISH":
-            self.bullish_articles.add(article.get("url"))
+            self.bullish_count += 1
 
         elif sentiment_result["signal"] == "BEARISH":
-            self.bearish_articles.add(article.get("url"))
+            self.bearish_count += 1
         
         # Update ticker impact tracking
-        for ticker_impact in ticker_info["tickers"]:
-            ticker = ticker_impact.ticker
-            if ticker not in self.ticker_impacts:
-                self.ticker_impacts[ticker] = {"positive": 0, "negative": 0}
-            
-            if ticker_impact.impact == "positive":
-                self.ticker_impacts[ticker]["positive"] += 1
-            elif ticker_impact.impact == "negative":
-                self.ticker_impacts[ticker]["negative"] += 1
+        self.aggregator.add_article(ticker_info["tickers"], sentiment_result["score"])
         
         print(f"Title: {title}")
         print(f"Sentiment: {sentiment_result['label'].upper()} (Score: {sentiment_result['score']:.4f})")
@@ -131,8 +265,10 @@ class NewsOrchestrator:
         
         print("-" * 50)
 
-        self.all_articles.append({
+        yield {
             "title": title,
+            "url": article.get("url"),
+            "published_at": article.get("publishedAt"),
             "sentiment": sentiment_result['label'].upper(),
             "score": sentiment_result['score'],
             "signal": sentiment_result['signal'],
@@ -145,4 +281,4 @@ class NewsOrchestrator:
                     "relevance": t.relevance,
                 } for t in ticker_info["tickers"]
             ]
-        })
\ No newline at end of file
+        }
@@ -0,0 +1,206 @@
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional, Union
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+FIELDS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+BAR_DTYPE = np.dtype(
+    [("date", "datetime64[D]")] + [(field, np.float64) for field in FIELDS]
+)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "prices"
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+
+def _empty_frame() -> pd.DataFrame:
+    return pd.DataFrame(columns=FIELDS, index=pd.DatetimeIndex([], name="Date"), dtype=np.float64)
+
+
+def adjust_ohlc(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Split/dividend-adjusted bars, as yfinance's Ticker.history returns by
+    default: Open, High and Low are scaled by Adj Close / Close, Close is
+    replaced by Adj Close, and the Adj Close column is dropped.
+    """
+    ratio = frame["Adj Close"] / frame["Close"]
+    adjusted = frame.drop(columns="Adj Close")
+    for field in ("Open", "High", "Low"):
+        adjusted[field] = frame[field] * ratio
+    adjusted["Close"] = frame["Adj Close"]
+    return adjusted
+
+
+class YFinanceSource:
+    """
+    Daily OHLCV bars from Yahoo Finance.
+
+    A source is anything with fetch(ticker, start, end) returning a
+    DataFrame indexed by date with the FIELDS columns, covering
+    start..end inclusive. Tests can pass their own source to PriceCache
+    to avoid the network.
+    """
+
+    def fetch(self, ticker: str, start: date, end: date) -> pd.DataFrame:
+        import yfinance as yf
+
+        data = yf.download(ticker, start=start, end=end + timedelta(days=1),
+                           auto_adjust=False, progress=False)
+        if data is None or data.empty:
+            return _empty_frame()
+        if isinstance(data.columns, pd.MultiIndex):
+            data = data.xs(ticker, axis=1, level=-1)
+        return data.reindex(columns=FIELDS)
+
+
+class DataFrameSource:
+    """
+    Serves bars from in-memory frames ({ticker: DataFrame}), e.g. fixtures.
+    Counts calls so callers can check what was actually fetched.
+    """
+
+    def __init__(self, frames: dict):
+        self.frames = frames
+        self.calls = []
+
+    def fetch(self, ticker: str, start: date, end: date) -> pd.DataFrame:
+        self.calls.append((ticker, start, end))
+        frame = self.frames.get(ticker)
+        if frame is None:
+            return _empty_frame()
+        return frame.loc[(frame.index >= pd.Timestamp(start)) & (frame.index <= pd.Timestamp(end))]
+
+
+class PriceCache:
+    """
+    Local per-ticker OHLCV store with incremental refresh.
+
+    Each ticker is one .npy file of BAR_DTYPE records sorted by date,
+    loaded memory-mapped. index.json records the date range already
+    fetched for each ticker, so a request only downloads the parts of
+    start..end that are not covered yet and merges them in.
+
+    The trailing edge (the last `refresh_interval` seconds of wall time)
+    is not re-fetched on every call: a ticker whose coverage was extended
+    to today within that interval is served from disk.
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR, source=None,
+                 refresh_interval: float = 3600.0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.source = source or YFinanceSource()
+        self.refresh_interval = refresh_interval
+        self._index_path = self.directory / "index.json"
+        self._index = self._load_index()
+
+    def get(self, ticker: str, start: DateLike, end: Optional[DateLike] = None) -> pd.DataFrame:
+        """
+        Returns:
+            DataFrame of FIELDS indexed by date for start..end inclusive
+            (end defaults to today).
+        """
+        start = pd.Timestamp(start).date()
+        end = pd.Timestamp(end).date() if end is not None else date.today()
+
+        bars = self._refresh(ticker, start, end)
+        dates = bars["date"]
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+        return self._to_frame(bars[lo:hi])
+
+    def get_many(self, tickers: list[str], start: DateLike, end: Optional[DateLike] = None,
+                 field: str = "Adj Close") -> pd.DataFrame:
+        """
+        Returns:
+            Wide DataFrame of `field` with one column per ticker.
+        """
+        return pd.DataFrame({ticker: self.get(ticker, start, end)[field] for ticker in tickers})
+
+    def _refresh(self, ticker: str, start: date, end: date) -> np.ndarray:
+        bars = self._load_bars(ticker)
+        covered = self._index.get(ticker)
+
+        missing = []
+        if covered is None:
+            missing.append((start, end))
+        else:
+            covered_start = date.fromisoformat(covered["start"])
+            covered_end = date.fromisoformat(covered["end"])
+            fresh = time.time() - covered["updated"] < self.refresh_interval
+            if start < covered_start:
+                missing.append((start, covered_start - timedelta(days=1)))
+            if end > covered_end or (end == covered_end == date.today() and not fresh):
+                missing.append((min(covered_end, end), end))
+
+        if not missing:
+            return bars
+
+        fetched = [self._from_frame(self.source.fetch(ticker, lo, hi)) for lo, hi in missing]
+        bars = self._merge(bars, *fetched)
+        self._save_bars(ticker, bars)
+
+        if covered is None:
+            new_start, new_end = start, end
+        else:
+            new_start = min(start, date.fromisoformat(covered["start"]))
+            new_end = max(end, date.fromisoformat(covered["end"]))
+        self._index[ticker] = {"start": new_start.isoformat(), "end": new_end.isoformat(), "updated": time.time()}
+        self._save_index()
+        return bars
+
+    @staticmethod
+    def _merge(*parts: np.ndarray) -> np.ndarray:
+        bars = np.concatenate([p for p in parts if len(p)]) if any(len(p) for p in parts) else np.empty(0, BAR_DTYPE)
+        # Later parts win on duplicate dates (re-fetched trailing bars).
+        order = np.argsort(bars["date"], kind="stable")[::-1]
+        _, first = np.unique(bars["date"][order], return_index=True)
+        return bars[order[first]]
+
+    @staticmethod
+    def _from_frame(frame: pd.DataFrame) -> np.ndarray:
+        bars = np.empty(len(frame), BAR_DTYPE)
+        if len(frame):
+            bars["date"] = pd.DatetimeIndex(frame.index).tz_localize(None).values.astype("datetime64[D]")
+            for field in FIELDS:
+                bars[field] = frame[field].to_numpy(dtype=np.float64) if field in frame else np.nan
+        return bars
+
+    @staticmethod
+    def _to_frame(bars: np.ndarray) -> pd.DataFrame:
+        index = pd.DatetimeIndex(bars["date"].astype("datetime64[ns]"), name="Date")
+        return pd.DataFrame({field: bars[field] for field in FIELDS}, index=index)
+
+    def _bars_path(self, ticker: str) -> Path:
+        return self.directory / f"{ticker.replace('/', '_')}.npy"
+
+    def _load_bars(self, ticker: str) -> np.ndarray:
+        path = self._bars_path(ticker)
+        if not path.exists():
+            return np.empty(0, BAR_DTYPE)
+        return np.load(path, mmap_mode="r")
+
+    def _save_bars(self, ticker: str, bars: np.ndarray):
+        path = self._bars_path(ticker)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(bars))
+        os.replace(tmp, path)
+
+    def _load_index(self) -> dict:
+        if not self._index_path.exists():
+            return {}
+        with open(self._index_path) as f:
+            return json.load(f)
+
+    def _save_index(self):
+        tmp = self._index_path.with_name(self._index_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self._index_path)
@@ -0,0 +1,124 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _fill_block(block: np.ndarray) -> tuple[np.ndarray, dict]:
+    """
+    Fill NaNs in a (T, n) float64 block in place: linear interpolation for
+    interior gaps, back-fill for leading gaps and forward-fill for trailing
+    gaps, all column-wise and vectorized. Returns the block and gap stats.
+    """
+    T, n = block.shape
+    block[~np.isfinite(block)] = np.nan
+    missing = np.isnan(block)
+
+    rows = np.arange(T)[:, None]
+    prev = np.maximum.accumulate(np.where(missing, -1, rows), axis=0)
+    nxt = np.minimum.accumulate(np.where(missing, T, rows)[::-1], axis=0)[::-1]
+
+    stats = {
+        "missing": missing.sum(axis=0),
+        "leading": (prev < 0).sum(axis=0),
+        "trailing": (nxt >= T).sum(axis=0),
+        "longest_gap": np.where(missing, rows - prev, 0).max(axis=0) if T else np.zeros(n, dtype=int),
+    }
+
+    if missing.any():
+        cols = np.broadcast_to(np.arange(n), (T, n))
+        prev_value = block[np.maximum(prev, 0), cols]
+        next_value = block[np.minimum(nxt, T - 1), cols]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = (rows - prev) / (nxt - prev)
+            interpolated = prev_value + (next_value - prev_value) * weight
+        filled = np.where(prev < 0, next_value, np.where(nxt >= T, prev_value, interpolated))
+        block[missing] = filled[missing]
+
+    return block, stats
+
+
+class PriceSanitizer:
+    """
+    Cleans a wide price matrix (one column per ticker) on a trading-day
+    calendar.
+
+    Unlike reindexing to calendar days, weekends are never materialized:
+    rows are the given calendar (by default the weekdays present in the
+    data). Infs become NaN, interior gaps are linearly interpolated, leading
+    gaps back-filled and trailing gaps forward-filled, in one vectorized
+    pass over a float64 block. Tickers with no data at all are dropped.
+
+    After transform(), append() extends the matrix bar by bar for live
+    data, forward-filling from the last valid price per ticker.
+    """
+
+    def __init__(self, calendar: Optional[pd.DatetimeIndex] = None):
+        self.calendar = calendar
+        self.columns = None
+        self.last_valid = None
+        self.stats = None
+        self.n_rows = 0
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        calendar = self.calendar
+        if calendar is None:
+            index = pd.DatetimeIndex(df.index).unique().sort_values()
+            calendar = index[index.dayofweek < 5]
+
+        block = df.reindex(calendar).to_numpy(dtype=np.float64, copy=True)
+        empty = ~np.isfinite(block).any(axis=0)
+        block, stats = _fill_block(block)
+
+        self.n_rows = len(calendar)
+        self.stats = pd.DataFrame(stats, index=df.columns)
+        self.stats["missing_pct"] = self.stats["missing"] / max(self.n_rows, 1) * 100
+        self.stats["dropped"] = empty
+
+        keep = ~empty
+        self.columns = df.columns[keep]
+        block = np.ascontiguousarray(block[:, keep])
+        self.last_valid = block[-1].copy() if len(block) else np.full(keep.sum(), np.nan)
+        return pd.DataFrame(block, index=calendar, columns=self.columns)
+
+    def append(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sanitize new bars for the tickers seen by transform().
+
+        Args:
+            bars: Rows of new prices; unknown columns are ignored, missing
+                ones are forward-filled
+
+        Returns:
+            DataFrame of the new rows with the same columns as transform().
+        """
+        if self.columns is None:
+            raise RuntimeError("Call transform() before append()")
+
+        block = bars.reindex(columns=self.columns).to_numpy(dtype=np.float64, copy=True)
+        block[~np.isfinite(block)] = np.nan
+        missing = np.isnan(block)
+
+        # forward-fill each column from the previous row (or last_valid)
+        rows = np.arange(len(block))[:, None]
+        prev = np.maximum.accumulate(np.where(missing, -1, rows), axis=0)
+        cols = np.broadcast_to(np.arange(block.shape[1]), block.shape)
+        carried = np.where(prev >= 0, block[np.maximum(prev, 0), cols], self.last_valid)
+        block[missing] = carried[missing]
+
+        if len(block):
+            self.last_valid = block[-1].copy()
+        self.n_rows += len(block)
+        self.stats.loc[self.columns, "missing"] += missing.sum(axis=0)
+        self.stats.loc[self.stats["dropped"], "missing"] += len(block)  # dropped tickers stay 100% missing
+        self.stats["missing_pct"] = self.stats["missing"] / max(self.n_rows, 1) * 100
+        return pd.DataFrame(block, index=bars.index, columns=self.columns)
+
+
+def sanitize_prices(df: pd.DataFrame, calendar: Optional[pd.DatetimeIndex] = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Returns:
+        Tuple (sanitized prices, per-ticker gap statistics).
+    """
+    sanitizer = PriceSanitizer(calendar)
+    return sanitizer.transform(df), sanitizer.stats
@@ -0,0 +1,169 @@
+import queue
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+STOP = object()  # shuts a pipeline down once everything before it has drained
+
+
+class CycleEnd:
+    """
+    Marker that flows through the pipeline behind the last article of a
+    fetch cycle. Stages flush pending batches when they see it, and may
+    annotate it with per-cycle counts for the stages after them. `summary`
+    holds snapshots of stage state taken on the stage's own thread, so later
+    stages can report them without reading state that is still changing.
+    """
+    __slots__ = ("cycle", "fetched", "new", "started", "summary")
+
+    def __init__(self, cycle: int, fetched: int = 0, started: Optional[float] = None):
+        self.cycle = cycle
+        self.fetched = fetched
+        self.new = 0
+        self.started = started if started is not None else time.monotonic()
+        self.summary = {}
+
+
+class Stage:
+    """
+    One pipeline step running on its own thread, reading from a bounded
+    inbox queue.
+
+    `fn` receives one item (or a list of up to `batch_size` items when
+    batch_size > 1, gathered for at most `max_wait` seconds) and returns an
+    iterable of outputs for the next stage, or None. `on_marker` is called
+    with each CycleEnd after the stage has flushed, and may also return
+    outputs. An exception in `fn` is logged and counted, and the stage moves
+    on to the next item.
+    """
+
+    def __init__(self,
+                 name: str,
+                 fn: Callable,
+                 maxsize: int = 256,
+                 batch_size: int = 1,
+                 max_wait: float = 0.05,
+                 on_marker: Optional[Callable] = None):
+        self.name = name
+        self.fn = fn
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.on_marker = on_marker
+        self.inbox = queue.Queue(maxsize=maxsize)
+        self.outbox = None  # next stage's inbox, set by Pipeline
+
+        self.processed = 0
+        self.emitted = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self.started = None
+        self._thread = None
+
+    def start(self):
+        self.started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name=f"stage-{self.name}", daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def metrics(self) -> dict:
+        elapsed = time.monotonic() - self.started if self.started else 0.0
+        return {
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "errors": self.errors,
+            "busy_seconds": self.busy_seconds,
+            "throughput": self.processed / elapsed if elapsed > 0 else 0.0,        # items per wall second
+            "capacity": self.processed / self.busy_seconds if self.busy_seconds > 0 else 0.0,  # items per busy second
+            "queue_depth": self.inbox.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+    def _emit(self, outputs):
+        # Blocking puts are the backpressure: a slow stage stalls the ones
+        # before it instead of letting queues grow.
+        for output in outputs:
+            self.emitted += 1
+            if self.outbox is not None:
+                self.outbox.put(output)
+
+    def _call(self, fn, arg, count: int):
+        start = time.perf_counter()
+        try:
+            outputs = fn(arg)
+            outputs = list(outputs) if outputs is not None else []
+        except Exception:
+            self.errors += 1
+            print(f"[{self.name}] stage error:")
+            traceback.print_exc()
+            outputs = []
+        self.busy_seconds += time.perf_counter() - start
+        self.processed += count
+        self._emit(outputs)
+
+    def _flush(self, pending: list):
+        if pending:
+            self._call(self.fn, pending if self.batch_size > 1 else pending[0], len(pending))
+            pending.clear()
+
+    def _run(self):
+        pending = []
+        deadline = 0.0
+        while True:
+            timeout = max(deadline - time.monotonic(), 0.0) if pending else None
+            try:
+                item = self.inbox.get(timeout=timeout)
+            except queue.Empty:
+                self._flush(pending)
+                continue
+            self.max_queue_depth = max(self.max_queue_depth, self.inbox.qsize() + 1)
+
+            if item is STOP or isinstance(item, CycleEnd):
+                self._flush(pending)
+                if item is STOP:
+                    if self.outbox is not None:
+                        self.outbox.put(STOP)
+                    return
+                if self.on_marker is not None:
+                    self._call(self.on_marker, item, 0)
+                if self.outbox is not None:
+                    self.outbox.put(item)
+                continue
+
+            if not pending:
+                deadline = time.monotonic() + self.max_wait
+            pending.append(item)
+            if len(pending) >= self.batch_size:
+                self._flush(pending)
+
+
+class Pipeline:
+    """
+    A chain of Stages connected by their bounded inbox queues.
+    """
+
+    def __init__(self, stages: list[Stage]):
+        self.stages = stages
+        for upstream, downstream in zip(stages, stages[1:]):
+            upstream.outbox = downstream.inbox
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def put(self, item):
+        """Feed the first stage; blocks while its inbox is full."""
+        self.stages[0].inbox.put(item)
+
+    def close(self, timeout: Optional[float] = None):
+        """Drain everything already queued, then stop all stages."""
+        self.put(STOP)
+        for stage in self.stages:
+            stage.join(timeout)
+
+    def metrics(self) -> dict:
+        return {stage.name: stage.metrics() for stage in self.stages}
@@ -1,7 +1,12 @@
 import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
 
+from .matcher import CompanyMatcher
+
 @dataclass
 class TickerImpact:
     ticker: str
@@ -9,6 +14,37 @@ class TickerImpact:
     impact: str     # "positive", "negative", or "neutral"
 
 
+class TickerBatch:
+    """
+    Tickers found across a batch of articles, stored as parallel lists.
+
+    Matches for article i are at positions offsets[i]:offsets[i + 1] of
+    `article_index`, `tickers` and `relevance`, in the same order
+    extract_with_context would return them.
+    """
+    __slots__ = ("article_index", "tickers", "relevance", "offsets")
+
+    def __init__(self):
+        self.article_index = []
+        self.tickers = []
+        self.relevance = []
+        self.offsets = [0]
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def for_article(self, i: int) -> list[tuple[str, str]]:
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return list(zip(self.tickers[start:end], self.relevance[start:end]))
+
+    def extend(self, other: "TickerBatch"):
+        base = len(self.offsets) - 1
+        self.article_index.extend(base + i for i in other.article_index)
+        self.tickers.extend(other.tickers)
+        self.relevance.extend(other.relevance)
+        self.offsets.extend(len(self.tickers) - len(other.tickers) + o for o in other.offsets[1:])
+
+
 class TickerExtractor:
 
     COMPANY_TICKERS = {
@@ -51,39 +87,87 @@ class TickerExtractor:
     
     TICKER_PATTERN = re.compile(r'[\$\(]([A-Z]{1,5})[\)\s\.,]')
     
-    def __init__(self, custom_mappings: Optional[dict] = None):
+    PERIOD_PATTERN = re.compile(r'^(\d+)(d|wk|mo|y)$')
+    PERIOD_DAYS = {"d": 1, "wk": 7, "mo": 31, "y": 366}
+    
+    def __init__(self, custom_mappings: Optional[dict] = None, price_cache=None):
+        """
+        Args:
+            custom_mappings: Extra {company name: ticker} entries
+            price_cache: Optional PriceCache; when set, fetch_data and
+                fetch_multiple_data read through it instead of downloading
+                full history on every call. fetch_data still returns
+                adjusted OHLC like yf.Ticker.history, but without the
+                Dividends and Stock Splits columns
+        """
         self.mappings = {**self.COMPANY_TICKERS}
         if custom_mappings:
             self.mappings.update(custom_mappings)
+        self.matcher = CompanyMatcher(self.mappings)
+        self.price_cache = price_cache
     
+    def _extract_set(self, text: str) -> set[str]:
+        tickers = self.matcher.find(text)
+        tickers.update(self.TICKER_PATTERN.findall(text))
+        return tickers
+
     def _extract(self, text: str) -> list[str]:
-        tickers = set()
-        text_lower = text.lower()
-        
-        explicit_matches = self.TICKER_PATTERN.findall(text)
-        tickers.update(explicit_matches)
-        
-        for company, ticker in self.mappings.items():
-            if company in text_lower:
-                tickers.add(ticker)
-        
-        return list(tickers)
+        return list(self._extract_set(text))
     
     def extract_with_context(self, title: str, description: str) -> list[dict]:
         results = []
         
-        title_tickers = self._extract(title)
-        desc_tickers = self._extract(description or "")
+        title_tickers = self._extract_set(title)
+        desc_tickers = self._extract_set(description or "")
         
         for ticker in title_tickers:
             results.append({"ticker": ticker, "relevance": "high"})
         
-        for ticker in desc_tickers:
-            if ticker not in title_tickers:
-                results.append({"ticker": ticker, "relevance": "medium"}) # or low
+        for ticker in desc_tickers - title_tickers:
+            results.append({"ticker": ticker, "relevance": "medium"}) # or low
         
         return results
 
+    def extract_batch(self, articles: list[dict], workers: int = 0, chunk_size: int = 500) -> TickerBatch:
+        """
+        Extract tickers from many articles in one call.
+
+        Args:
+            articles: Dicts with "title" and "description" keys (NewsAPI shape)
+            workers: If > 1, split the batch into chunks of `chunk_size`
+                articles and process them in a pool of this many processes
+            chunk_size: Articles per worker task
+
+        Returns:
+            TickerBatch with the same relevance semantics as
+            extract_with_context ("high" in title, "medium" in description only).
+        """
+        if workers > 1 and len(articles) > chunk_size:
+            chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+            batch = TickerBatch()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for part in pool.map(self.extract_batch, chunks):
+                    batch.extend(part)
+            return batch
+
+        batch = TickerBatch()
+        article_index, tickers, relevance, offsets = batch.article_index, batch.tickers, batch.relevance, batch.offsets
+        for i, article in enumerate(articles):
+            title_tickers = self._extract_set(article.get("title") or "")
+            desc_tickers = self._extract_set(article.get("description") or "") - title_tickers
+
+            for ticker in title_tickers:
+                article_index.append(i)
+                tickers.append(ticker)
+                relevance.append("high")
+            for ticker in desc_tickers:
+                article_index.append(i)
+                tickers.append(ticker)
+                relevance.append("medium")
+            offsets.append(len(tickers))
+
+        return batch
+
     def get_tickers_with_impact(
         self, 
         title: str, 
@@ -124,6 +208,19 @@ class TickerExtractor:
         return results
     
     def fetch_data(self, ticker: str, period: str = "1y"):
+        match = self.PERIOD_PATTERN.match(period)
+        if self.price_cache is not None and match:
+            from .price_cache import adjust_ohlc
+
+            days = int(match.group(1)) * self.PERIOD_DAYS[match.group(2)]
+            try:
+                # Adjusted like yf.Ticker.history, so Close means the same
+                # with or without the cache.
+                return adjust_ohlc(self.price_cache.get(ticker, start=date.today() - timedelta(days=days)))
+            except Exception as e:
+                print(f"Error fetching data for {ticker}: {e}")
+                return None
+
         import yfinance as yf
         try:
             stock = yf.Ticker(ticker)
@@ -133,9 +230,12 @@ class TickerExtractor:
             print(f"Error fetching data for {ticker}: {e}")
             return None
         
-    def fetch_multiple_data(self, tickers: list[str]):
+    def fetch_multiple_data(self, tickers: list[str], start: str = "2023-01-01", end: Optional[str] = None):
+        if self.price_cache is not None:
+            return self.price_cache.get_many(tickers, start=start, end=end, field="Adj Close")
+
         import yfinance as yf
-        data = yf.download(tickers, start="2023-01-01", auto_adjust=False)
+        data = yf.download(tickers, start=start, end=end, auto_adjust=False)
         
         if data is not None:
             return data['Adj Close']
@@ -143,6 +243,11 @@ class TickerExtractor:
         return
 
 
+@lru_cache(maxsize=1)
+def _default_extractor() -> TickerExtractor:
+    return TickerExtractor()
+
+
 def get_tickers(
     content: str,
     sentiment_result: Optional[dict] = None,
@@ -154,14 +259,14 @@ def get_tickers(
     Args:
         content: The text content (can be title, description, or combined)
         sentiment_result: Optional dict with 'label' and 'score' keys from SentimentAnalyzer
-        extractor: Optional TickerExtractor instance (creates new one if not provided)
+        extractor: Optional TickerExtractor instance (a shared default is used if not provided)
         
     Returns:
         List of TickerImpact objects with ticker, relevance, impact, and confidence.
         Returns empty list if no tickers are found.
     """
     if extractor is None:
-        extractor = TickerExtractor()
+        extractor = _default_extractor()
     
     raw_tickers = extractor._extract(content)
     
@@ -210,7 +315,7 @@ def get_tickers_sentiment(
             - 'affected_negatively': List of tickers with negative impact
     """
     if extractor is None:
-        extractor = TickerExtractor()
+        extractor = _default_extractor()
     
     if sentiment_result:
         label = sentiment_result.get("label", "neutral").lower()
@@ -1,9 +1,16 @@
-from options.black_scholes import BlackScholesModel, BlackScholesGreeks
+from typing import Optional
 
+import numpy as np
 
-class portfolio:
+from options.black_scholes import BlackScholesModel, BlackScholesGreeks, greeks
+
+
+POSITION_TYPES = ("stock", "call", "put")
+
+
+class Portfolio:
     '''
-    TODO: work on notebooks
+    Columnar book of option and stock positions across many underlyings.
 
     Portfolio equation:
     PI =  risky_asset + alpha(i) * asset(i)
@@ -16,10 +23,229 @@ class portfolio:
     diff by Stock price S:
         dPI = dC - alpha(1) = 0
         alpha(1) = dC/dS = delta of option -> thus delta hedging
+
+    Positions are kept as parallel columns (underlying, strike, expiry,
+    type, quantity, sigma) and Greeks are evaluated for the whole book in
+    one vectorized pass, then summed per underlying.
     '''
-    
-    pass
 
+    def __init__(self, r: float = 0.05):
+        self.r = r
+        self.spots = {}  # {ticker: spot price}
+        self._underlying = []
+        self._strike = []
+        self._expiry = []
+        self._type = []
+        self._quantity = []
+        self._sigma = []
+        self._arrays = None
+
+    def __len__(self):
+        return len(self._underlying)
+
+    def add_option(self, underlying: str, strike: float, expiry: float, option_type: str,
+                   quantity: float = 1, sigma: float = 0.2):
+        '''
+        Args:
+            underlying: Ticker of the underlying
+            strike: Strike price
+            expiry: Time to expiry in years
+            option_type: "call" or "put"
+            quantity: Number of contracts (negative for short)
+            sigma: Volatility used to price the position
+        '''
+        if option_type not in ("call", "put"):
+            raise ValueError(f"Unknown option type: {option_type}")
+        self._append(underlying, strike, expiry, POSITION_TYPES.index(option_type), quantity, sigma)
+
+    def add_stock(self, underlying: str, quantity: float):
+        self._append(underlying, np.nan, np.nan, 0, quantity, np.nan)
+
+    def add_positions(self, underlying, strike, expiry, option_type, quantity, sigma):
+        '''
+        Bulk-append positions from parallel sequences. Stock rows use
+        option_type "stock" and ignore strike, expiry and sigma.
+        '''
+        # Materialize first so generators are consumed once and lengths
+        # can be checked before any column is touched.
+        columns = [list(c) for c in (underlying, strike, expiry, option_type, quantity, sigma)]
+        if len({len(c) for c in columns}) > 1:
+            raise ValueError(f"Position columns have different lengths: {[len(c) for c in columns]}")
+        underlying, strike, expiry, option_type, quantity, sigma = columns
+
+        for t in set(option_type):
+            if t not in POSITION_TYPES:
+                raise ValueError(f"Unknown position type: {t}")
+        self._underlying.extend(underlying)
+        self._strike.extend(strike)
+        self._expiry.extend(expiry)
+        self._type.extend(POSITION_TYPES.index(t) for t in option_type)
+        self._quantity.extend(quantity)
+        self._sigma.extend(sigma)
+        self._arrays = None
+
+    def set_spot(self, ticker: str, price: float):
+        self.spots[ticker] = price
+
+    def _append(self, underlying, strike, expiry, type_code, quantity, sigma):
+        self._underlying.append(underlying)
+        self._strike.append(strike)
+        self._expiry.append(expiry)
+        self._type.append(type_code)
+        self._quantity.append(quantity)
+        self._sigma.append(sigma)
+        self._arrays = None
+
+    def _columns(self) -> dict:
+        if self._arrays is None:
+            tickers, underlying_idx = np.unique(np.asarray(self._underlying, dtype=object).astype(str),
+                                                return_inverse=True)
+            tickers = tickers.tolist()
+            self._arrays = {
+                "tickers": tickers,
+                "ticker_index": {ticker: i for i, ticker in enumerate(tickers)},
+                "underlying_idx": underlying_idx,
+                "strike": np.asarray(self._strike, dtype=np.float64),
+                "expiry": np.asarray(self._expiry, dtype=np.float64),
+                "type": np.asarray(self._type, dtype=np.int8),
+                "quantity": np.asarray(self._quantity, dtype=np.float64),
+                "sigma": np.asarray(self._sigma, dtype=np.float64),
+                # rows of underlying i are order[offsets[i]:offsets[i + 1]]
+                "order": np.argsort(underlying_idx, kind="stable"),
+                "offsets": np.concatenate(([0], np.cumsum(np.bincount(underlying_idx, minlength=len(tickers))))),
+            }
+        return self._arrays
+
+    def _position_greeks(self, cols: dict, rows, spot) -> tuple:
+        '''
+        Per-position (delta, gamma, vega) for the selected rows, already
+        scaled by quantity.
+        '''
+        position_type = cols["type"][rows]
+        is_stock = position_type == 0
+        options = ~is_stock
+
+        delta = np.where(is_stock, 1.0, 0.0)
+        gamma = np.zeros_like(delta)
+        vega = np.zeros_like(delta)
+
+        if options.any():
+            spot = np.broadcast_to(spot, delta.shape)
+            g = greeks(spot[options], cols["strike"][rows][options], cols["expiry"][rows][options],
+                       self.r, cols["sigma"][rows][options])
+            is_call = position_type[options] == 1
+            delta[options] = np.where(is_call, g.delta_call, g.delta_put)
+            gamma[options] = g.gamma
+            vega[options] = g.vega
+
+        quantity = cols["quantity"][rows]
+        return delta * quantity, gamma * quantity, vega * quantity
+
+    def greeks_by_underlying(self) -> dict:
+        '''
+        Returns:
+            Dict of {ticker: {"delta", "gamma", "vega"}} aggregated over the book.
+        '''
+        if not self._underlying:
+            return {}
+
+        cols = self._columns()
+        tickers = cols["tickers"]
+        missing = [t for t in tickers if t not in self.spots]
+        if missing:
+            raise ValueError(f"No spot price set for: {', '.join(missing)}")
+
+        spot = np.array([self.spots[t] for t in tickers], dtype=np.float64)[cols["underlying_idx"]]
+        delta, gamma, vega = self._position_greeks(cols, slice(None), spot)
+
+        idx, n = cols["underlying_idx"], len(tickers)
+        totals = {
+            "delta": np.bincount(idx, weights=delta, minlength=n),
+            "gamma": np.bincount(idx, weights=gamma, minlength=n),
+            "vega": np.bincount(idx, weights=vega, minlength=n),
+        }
+        return {
+            ticker: {name: float(values[i]) for name, values in totals.items()}
+            for i, ticker in enumerate(tickers)
+        }
+
+    def greeks_for_underlying(self, ticker: str) -> dict:
+        '''
+        Aggregate {"delta", "gamma", "vega"} for a single underlying,
+        evaluating only the positions written on it.
+        '''
+        cols = self._columns()
+        i = cols["ticker_index"].get(ticker)
+        if i is None:
+            return {"delta": 0.0, "gamma": 0.0, "vega": 0.0}
+        if ticker not in self.spots:
+            raise ValueError(f"No spot price set for: {ticker}")
+
+        rows = cols["order"][cols["offsets"][i]:cols["offsets"][i + 1]]
+        delta, gamma, vega = self._position_greeks(cols, rows, self.spots[ticker])
+        return {"delta": float(delta.sum()), "gamma": float(gamma.sum()), "vega": float(vega.sum())}
+
+    def hedge_quantities(self) -> dict:
+        '''
+        Returns:
+            Dict of {ticker: shares of stock to trade} that brings each
+            underlying's book to zero delta.
+        '''
+        return {
+            ticker: -aggregate["delta"]
+            for ticker, aggregate in self.greeks_by_underlying().items()
+        }
+
+
+class PortfolioHedger:
+    '''
+    Keeps a Portfolio delta-neutral under a live price feed.
+
+    Per-underlying Greek aggregates and the stock hedge currently held are
+    cached. A tick on one underlying only re-evaluates the positions on that
+    underlying, and a hedge trade is emitted only once the target hedge has
+    drifted from the held hedge by more than `band` shares.
+    '''
+
+    def __init__(self, portfolio: Portfolio, band: float = 0.0):
+        self.portfolio = portfolio
+        self.band = band
+        self.aggregates = {}  # {ticker: {"delta", "gamma", "vega"}}
+        self.hedges = {}      # {ticker: stock hedge currently held}
+
+    def rebalance(self) -> dict:
+        '''
+        Full recomputation over the whole book; use after positions change.
+
+        Returns:
+            Dict of {ticker: shares to trade} for hedges outside the band.
+        '''
+        self.aggregates = self.portfolio.greeks_by_underlying()
+        trades = {}
+        for ticker in self.aggregates:
+            trade = self._hedge_trade(ticker)
+            if trade is not None:
+                trades[ticker] = trade
+        return trades
+
+    def on_price_update(self, ticker: str, price: float) -> dict:
+        '''
+        Returns:
+            {ticker: shares to trade} if the hedge moved beyond the band,
+            otherwise an empty dict.
+        '''
+        self.portfolio.set_spot(ticker, price)
+        self.aggregates[ticker] = self.portfolio.greeks_for_underlying(ticker)
+        trade = self._hedge_trade(ticker)
+        return {} if trade is None else {ticker: trade}
+
+    def _hedge_trade(self, ticker: str) -> Optional[float]:
+        target = -self.aggregates[ticker]["delta"]
+        trade = target - self.hedges.get(ticker, 0.0)
+        if abs(trade) <= self.band:
+            return None
+        self.hedges[ticker] = target
+        return trade
 
 
 class HedgeDelta:
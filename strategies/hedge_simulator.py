@@ -0,0 +1,145 @@
+from typing import Optional
+
+import numpy as np
+
+from options.black_scholes import _d1_d2, price_chain
+from options.normal import norm_cdf
+
+TRADING_DAYS = 252
+
+
+class DeltaHedgeSimulator:
+    '''
+    Backtest of a delta-hedged option position over many price paths.
+
+    The book holds `quantity` options (negative for short) and trades stock
+    to stay delta neutral every `rebalance_every` steps (the last interval
+    before expiry is shorter when steps is not a multiple). Cash earns r, each
+    stock trade pays `transaction_cost` as a fraction of traded notional,
+    and everything is settled at expiry against the option payoff.
+
+    Paths x time steps are evaluated as NumPy blocks, `chunk_size` paths at
+    a time, so memory stays bounded by one chunk regardless of n_paths.
+    '''
+
+    def __init__(self, K, T, r, sigma, option_type: str = "call", quantity: float = -1,
+                 steps: int = TRADING_DAYS, rebalance_every: int = 1,
+                 transaction_cost: float = 0.0, hedge_sigma: Optional[float] = None):
+        if option_type not in ("call", "put"):
+            raise ValueError(f"Unknown option type: {option_type}")
+
+        self.K = K
+        self.T = T
+        self.r = r
+        self.sigma = sigma                     # volatility of the simulated paths
+        self.hedge_sigma = hedge_sigma or sigma  # volatility the hedger prices with
+        self.option_type = option_type
+        self.quantity = quantity
+        self.steps = steps
+        self.rebalance_every = rebalance_every
+        self.transaction_cost = transaction_cost
+
+    def simulate(self, S0: float, n_paths: int, mu: Optional[float] = None,
+                 seed: Optional[int] = None, chunk_size: int = 10_000) -> dict:
+        '''
+        Run the hedge over `n_paths` GBM paths with drift `mu` (defaults to r).
+        '''
+        rng = np.random.default_rng(seed)
+        mu = self.r if mu is None else mu
+        dt = self.T / self.steps
+        drift = (mu - 0.5 * self.sigma ** 2) * dt
+        shock = self.sigma * np.sqrt(dt)
+
+        results = self._allocate(n_paths)
+        for start in range(0, n_paths, chunk_size):
+            n = min(chunk_size, n_paths - start)
+            log_paths = np.empty((n, self.steps + 1))
+            log_paths[:, 0] = 0.0
+            np.cumsum(drift + shock * rng.standard_normal((n, self.steps)), axis=1, out=log_paths[:, 1:])
+            paths = S0 * np.exp(log_paths, out=log_paths)
+            self._run_chunk(paths, results, slice(start, start + n))
+
+        return results
+
+    def replay(self, prices, chunk_size: int = 10_000) -> dict:
+        '''
+        Run the hedge over given price paths of shape (n_paths, n_bars) or
+        (n_bars,). The option's life T is spread evenly over the bars.
+        '''
+        prices = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+        n_paths, n_bars = prices.shape
+
+        results = self._allocate(n_paths)
+        for start in range(0, n_paths, chunk_size):
+            chunk = slice(start, min(start + chunk_size, n_paths))
+            self._run_chunk(prices[chunk], results, chunk)
+        return results
+
+    def replay_history(self, ticker: str, period: str = "1y") -> dict:
+        '''
+        Replay the hedge over historical closes from TickerExtractor.fetch_data.
+        '''
+        from src.pipeline.tickers import TickerExtractor
+
+        data = TickerExtractor().fetch_data(ticker, period=period)
+        if data is None or data.empty:
+            raise ValueError(f"No price history for {ticker}")
+        return self.replay(data["Close"].to_numpy())
+
+    def _allocate(self, n_paths: int) -> dict:
+        return {
+            "pnl": np.empty(n_paths),
+            "hedging_error": np.empty(n_paths),
+            "transaction_costs": np.empty(n_paths),
+        }
+
+    def _run_chunk(self, paths: np.ndarray, results: dict, out: slice):
+        n_bars = paths.shape[1]
+        dt = self.T / (n_bars - 1)
+        hedge_bars = np.arange(0, n_bars, self.rebalance_every)
+        if hedge_bars[-1] != n_bars - 1:
+            hedge_bars = np.append(hedge_bars, n_bars - 1)   # shorter final interval
+        rebalance = paths[:, hedge_bars]                      # S at t_0 .. t_M (t_M = expiry)
+        t = hedge_bars * dt
+        tau = self.T - t[:-1]                                 # time left at each hedge date
+
+        S_hedge = rebalance[:, :-1]
+        d1, _ = _d1_d2(S_hedge, self.K, tau, self.r, self.hedge_sigma)
+        delta = norm_cdf(d1) if self.option_type == "call" else norm_cdf(d1) - 1.0
+
+        # Stock held over [t_j, t_j+1), then liquidated at expiry.
+        holdings = -self.quantity * delta
+        trades = np.diff(holdings, axis=1, prepend=0.0, append=0.0)
+        growth = np.exp(self.r * (self.T - t))
+        stock_cash = -(trades * rebalance * growth).sum(axis=1)
+        costs = (self.transaction_cost * np.abs(trades) * rebalance * growth).sum(axis=1)
+
+        call, put = price_chain(rebalance[:, 0], self.K, self.T, self.r, self.hedge_sigma)
+        premium = call if self.option_type == "call" else put
+        S_T = rebalance[:, -1]
+        payoff = np.maximum(S_T - self.K, 0.0) if self.option_type == "call" else np.maximum(self.K - S_T, 0.0)
+        option_pnl = self.quantity * (payoff - premium * np.exp(self.r * self.T))
+
+        hedging_error = option_pnl + stock_cash
+        results["hedging_error"][out] = hedging_error
+        results["transaction_costs"][out] = costs
+        results["pnl"][out] = hedging_error - costs
+
+    @staticmethod
+    def summary(results: dict, percentiles=(1, 5, 50, 95, 99)) -> dict:
+        pnl = results["pnl"]
+        return {
+            "mean_pnl": float(pnl.mean()),
+            "std_pnl": float(pnl.std()),
+            "percentiles": dict(zip(percentiles, np.percentile(pnl, percentiles).tolist())),
+            "hedging_error_std": float(results["hedging_error"].std()),
+            "mean_transaction_costs": float(results["transaction_costs"].mean()),
+        }
+
+
+if __name__ == "__main__":
+    for every in (1, 5, 21, 63):
+        simulator = DeltaHedgeSimulator(K=100, T=1, r=0.05, sigma=0.2, rebalance_every=every,
+                                        transaction_cost=0.0005)
+        results = simulator.simulate(S0=100, n_paths=100_000, seed=0)
+        print(f"Rebalance every {every} step(s): {DeltaHedgeSimulator.summary(results)}")
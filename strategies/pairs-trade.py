@@ -5,12 +5,13 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.pipeline.tickers import TickerExtractor
+from src.pipeline.price_cache import PriceCache
 import pandas as pd
 
 TICKERS = []
 
 if __name__ == "__main__":
-    TE = TickerExtractor()
+    TE = TickerExtractor(price_cache=PriceCache())
     data = TE.fetch_multiple_data(TICKERS)
 
     print(data)
\ No newline at end of file
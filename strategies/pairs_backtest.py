@@ -0,0 +1,159 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+_PRICES = None  # worker view of the shared price matrix
+_SHM = None
+
+
+def _attach_prices(name: str, shape: tuple, dtype: str):
+    global _PRICES, _SHM
+    _SHM = shared_memory.SharedMemory(name=name)
+    _PRICES = np.ndarray(shape, dtype=dtype, buffer=_SHM.buf)
+
+
+def rolling_zscore(spread: np.ndarray, window: int) -> np.ndarray:
+    '''
+    Z-score of `spread` against its trailing `window` bars (current bar
+    included, sample std), using the first bars as an expanding window.
+    NaN until two bars are available, matching PairsSignal.
+    '''
+    T = len(spread)
+    cs = np.concatenate(([0.0], np.cumsum(spread)))
+    cs2 = np.concatenate(([0.0], np.cumsum(spread * spread)))
+    end = np.arange(1, T + 1)
+    start = np.maximum(end - window, 0)
+    n = end - start
+
+    mean = (cs[end] - cs[start]) / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (cs2[end] - cs2[start] - n * mean * mean) / (n - 1)
+        return (spread - mean) / np.sqrt(np.maximum(var, 0.0))
+
+
+def _hysteresis(enter: np.ndarray, leave: np.ndarray) -> np.ndarray:
+    '''
+    1 from each bar where `enter` holds until the next bar where `leave`
+    holds, 0 otherwise. `enter` and `leave` must be mutually exclusive.
+    '''
+    T = enter.shape[0]
+    rows = np.arange(T)[:, None]
+    last_enter = np.maximum.accumulate(np.where(enter, rows, -1), axis=0)
+    last_leave = np.maximum.accumulate(np.where(leave, rows, -1), axis=0)
+    return (last_enter > last_leave).astype(np.int8)
+
+
+def positions(z: np.ndarray, entry_z: np.ndarray, exit_z: np.ndarray) -> np.ndarray:
+    '''
+    Spread positions (+1 long, -1 short, 0 flat) for one z-score series
+    and C threshold combinations, as a (T, C) array. Long and short legs
+    are independent hysteresis loops. For -entry_z < exit_z < entry_z a
+    bar that opens one leg always closes the other, so both are never held
+    at once and this matches PairsSignal's state machine. Outside that range
+    the two disagree, which is why backtest_pairs rejects such thresholds.
+    '''
+    z = z[:, None]
+    long = _hysteresis(z < -entry_z, z >= -exit_z)
+    short = _hysteresis(z > entry_z, z <= exit_z)
+    return long - short
+
+
+def _evaluate(task: tuple) -> list[dict]:
+    i, j, window, entry_z, exit_z, cost = task
+    p1, p2 = _PRICES[:, i], _PRICES[:, j]
+
+    z = rolling_zscore(p1 / p2, window)
+    pos = positions(z, entry_z, exit_z).astype(np.float64)
+
+    # Long spread = long ticker1, short ticker2 (equal notional); the
+    # position set on bar t earns bar t+1's return.
+    spread_ret = np.zeros_like(p1)
+    spread_ret[1:] = p1[1:] / p1[:-1] - p2[1:] / p2[:-1]
+    held = np.vstack([np.zeros((1, pos.shape[1])), pos[:-1]])
+    turnover = np.abs(np.diff(pos, axis=0, prepend=0.0))
+    returns = held * spread_ret[:, None] - 2 * cost * turnover
+
+    equity = 1.0 + np.cumsum(returns, axis=0)
+    drawdown = (np.maximum.accumulate(equity, axis=0) - equity).max(axis=0)
+    std = returns.std(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, returns.mean(axis=0) / std * np.sqrt(TRADING_DAYS), 0.0)
+    trades = ((pos != 0) & (np.diff(pos, axis=0, prepend=0.0) != 0)).sum(axis=0)
+
+    return [
+        {
+            "pair": (i, j),
+            "window": window,
+            "entry_z": float(entry_z[c]),
+            "exit_z": float(exit_z[c]),
+            "pnl": float(equity[-1, c] - 1.0),
+            "sharpe": float(sharpe[c]),
+            "max_drawdown": float(drawdown[c]),
+            "trades": int(trades[c]),
+        }
+        for c in range(pos.shape[1])
+    ]
+
+
+def backtest_pairs(prices: pd.DataFrame, pairs: list[tuple], windows=(15,), entry_z=(1.0,),
+                   exit_z=(0.0,), transaction_cost: float = 0.0, workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Sweep ratio z-score strategies over pairs x windows x thresholds.
+
+    Every (pair, window) task evaluates all entry/exit combinations at once,
+    vectorized over time. Tasks run in a process pool; the price matrix is
+    placed in shared memory once and each worker maps it, so memory does not
+    grow with the number of workers.
+
+    Parameters:
+    - prices (pd.DataFrame): Sanitized prices, one column per ticker.
+    - pairs (list): (ticker1, ticker2) tuples; the spread is ticker1 / ticker2.
+    - windows, entry_z, exit_z: Parameter grids. Combinations outside
+      -entry_z < exit_z < entry_z are skipped; if none remain, ValueError.
+    - transaction_cost (float): Cost per unit of notional traded, per leg.
+    - workers (int): Pool size; None uses all cores, 0 runs in-process.
+    Returns:
+    - pd.DataFrame with one row per (pair, window, entry_z, exit_z) and
+      pnl, sharpe, max_drawdown and trades columns.
+    """
+    matrix = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+    columns = {ticker: k for k, ticker in enumerate(prices.columns)}
+    thresholds = [(e, x) for e, x in product(entry_z, exit_z) if -e < x < e]
+    if not thresholds:
+        raise ValueError("No (entry_z, exit_z) combination satisfies -entry_z < exit_z < entry_z")
+    entry = np.array([e for e, _ in thresholds])
+    exit_ = np.array([x for _, x in thresholds])
+
+    tasks = [
+        (columns[t1], columns[t2], window, entry, exit_, transaction_cost)
+        for (t1, t2), window in product(pairs, windows)
+    ]
+
+    if workers == 0 or len(tasks) <= 1:
+        global _PRICES
+        _PRICES = matrix
+        rows = [row for task in tasks for row in _evaluate(task)]
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=matrix.nbytes)
+        try:
+            np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)[:] = matrix
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_prices,
+                                     initargs=(shm.name, matrix.shape, matrix.dtype.str)) as pool:
+                rows = [row for result in pool.map(_evaluate, tasks, chunksize=8) for row in result]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    tickers = list(prices.columns)
+    results = pd.DataFrame(rows)
+    if results.empty:
+        return results
+    results.insert(0, "ticker1", [tickers[i] for i, _ in results["pair"]])
+    results.insert(1, "ticker2", [tickers[j] for _, j in results["pair"]])
+    return results.drop(columns="pair")
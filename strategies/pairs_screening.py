@@ -0,0 +1,116 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+_PRICES = None       # price matrix of the current worker process
+_COINT_KWARGS = {}
+
+
+def _init_worker(prices: np.ndarray, coint_kwargs: dict):
+    global _PRICES, _COINT_KWARGS
+    _PRICES = prices
+    _COINT_KWARGS = coint_kwargs
+
+
+def _coint_pvalues(pairs: np.ndarray) -> np.ndarray:
+    from statsmodels.tsa.stattools import coint
+
+    return np.array([coint(_PRICES[:, i], _PRICES[:, j], **_COINT_KWARGS)[1] for i, j in pairs])
+
+
+def prefilter_pairs(prices: np.ndarray, min_corr: float = 0.7, max_half_life: Optional[float] = None):
+    """
+    Cheap vectorized screen over all n(n-1)/2 pairs.
+
+    For every pair (i, j) the OLS hedge ratio of i on j and the AR(1)
+    mean-reversion speed of the spread are derived from three n x n
+    covariance matrices (levels, lagged levels, and differences against
+    lagged levels), so no per-pair regression or residual series is built.
+
+    Args:
+        prices: (T, n) price matrix
+        min_corr: Minimum absolute correlation of price levels
+        max_half_life: Maximum spread half-life in bars (defaults to T / 2)
+
+    Returns:
+        Tuple (i, j, beta, half_life) of arrays for the surviving pairs, i < j.
+    """
+    T, n = prices.shape
+    max_half_life = T / 2 if max_half_life is None else max_half_life
+
+    cov = np.cov(prices, rowvar=False)
+    std = np.sqrt(np.diag(cov))
+    corr = cov / np.outer(std, std)
+
+    i, j = np.triu_indices(n, k=1)
+    keep = np.abs(corr[i, j]) >= min_corr
+    i, j = i[keep], j[keep]
+    beta = cov[i, j] / cov[j, j]
+
+    # spread e = y - beta * x; AR(1) on de_t = lam * e_{t-1} + c
+    lagged = prices[:-1] - prices[:-1].mean(axis=0)
+    diffs = np.diff(prices, axis=0)
+    diffs = diffs - diffs.mean(axis=0)
+    lag_cov = lagged.T @ lagged
+    cross_cov = diffs.T @ lagged  # cross_cov[a, b] = sum(d_a * lag_b)
+
+    spread_var = lag_cov[i, i] - 2 * beta * lag_cov[i, j] + beta ** 2 * lag_cov[j, j]
+    spread_cross = (cross_cov[i, i] - beta * (cross_cov[j, i] + cross_cov[i, j])
+                    + beta ** 2 * cross_cov[j, j])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lam = spread_cross / spread_var
+        half_life = np.where(lam < 0, -np.log(2) / np.log1p(np.maximum(lam, -1 + 1e-12)), np.inf)
+
+    keep = half_life <= max_half_life
+    return i[keep], j[keep], beta[keep], half_life[keep]
+
+
+def find_cointegrated_pairs(data, p_value_threshold: float = 0.05, min_corr: float = 0.7,
+                            max_half_life: Optional[float] = None, workers: Optional[int] = None,
+                            chunk_size: int = 64, coint_kwargs: Optional[dict] = None):
+    """
+    Screen a price universe for cointegrated pairs.
+
+    Only pairs that pass prefilter_pairs are given the Engle-Granger test
+    (statsmodels coint), which runs in a process pool that receives the
+    price matrix once per worker.
+
+    Parameters:
+    - data (pd.DataFrame): DataFrame where columns are tickers and rows are time series data.
+    - p_value_threshold (float): The significance level for cointegration testing.
+    - min_corr, max_half_life: Pre-filter settings, see prefilter_pairs.
+    - workers (int): Pool size; None uses all cores, 0 runs in-process.
+    - coint_kwargs (dict): Passed to statsmodels coint, e.g. {"autolag": None, "maxlag": 1}
+      skips the per-pair lag search, which dominates the cost of each test.
+    Returns:
+    - pvalue_matrix (numpy.ndarray): Cointegration p-values for tested pairs (i < j), 1 elsewhere.
+    - pairs (list): (ticker1, ticker2, pvalue) tuples below the threshold, lowest p-value first.
+    """
+    prices = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+    keys = list(data.columns)
+    n = prices.shape[1]
+    pvalue_matrix = np.ones((n, n))
+
+    i, j, _, _ = prefilter_pairs(prices, min_corr=min_corr, max_half_life=max_half_life)
+    candidates = np.column_stack([i, j])
+    chunks = [candidates[k:k + chunk_size] for k in range(0, len(candidates), chunk_size)]
+
+    coint_kwargs = coint_kwargs or {}
+    if workers == 0 or len(chunks) <= 1:
+        _init_worker(prices, coint_kwargs)
+        pvalues = [_coint_pvalues(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(prices, coint_kwargs)) as pool:
+            pvalues = list(pool.map(_coint_pvalues, chunks))
+
+    if pvalues:
+        pvalue_matrix[i, j] = np.concatenate(pvalues)
+
+    pairs = [
+        (keys[a], keys[b], float(pvalue_matrix[a, b]))
+        for a, b in zip(i, j)
+        if pvalue_matrix[a, b] < p_value_threshold
+    ]
+    pairs.sort(key=lambda x: x[2])
+    return pvalue_matrix, pairs
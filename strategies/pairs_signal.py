@@ -0,0 +1,107 @@
+import numpy as np
+
+
+class PairsSignal:
+    '''
+    Rolling z-score entry/exit signals for many pairs at once.
+
+    Each update takes one new spread value per pair (e.g. the price ratio
+    ticker1 / ticker2) and maintains the rolling mean and variance over the
+    last `window` bars with Welford-style add/replace updates, so a bar
+    costs O(n_pairs) regardless of the window length. The exact moments are
+    recomputed from the ring buffer once per window to stop floating-point
+    drift from accumulating.
+
+    Positions follow a simple state machine per pair:
+        flat  -> long  (+1) when z < -entry_z
+        flat  -> short (-1) when z >  entry_z
+        long  -> flat       when z >= -exit_z
+        short -> flat       when z <=  exit_z
+
+    run() replays a (T, n_pairs) block through update(), so backtests and
+    live streaming share the same code path.
+    '''
+
+    def __init__(self, n_pairs: int, window: int = 15, entry_z: float = 1.0, exit_z: float = 0.0):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.n_pairs = n_pairs
+        self.window = window
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+        self.reset()
+
+    def reset(self):
+        self._buffer = np.zeros((self.window, self.n_pairs))
+        self._count = 0
+        self._mean = np.zeros(self.n_pairs)
+        self._m2 = np.zeros(self.n_pairs)
+        self.position = np.zeros(self.n_pairs, dtype=np.int8)
+
+    def update(self, spread) -> tuple:
+        '''
+        Args:
+            spread: Latest spread value for each pair, shape (n_pairs,)
+
+        Returns:
+            Tuple (z, position, orders) of (n_pairs,) arrays, where orders is
+            the change in position on this bar (+1/-1/+2/-2, 0 for no trade).
+            z is NaN until two bars have been seen.
+        '''
+        x = np.asarray(spread, dtype=np.float64)
+        slot = self._count % self.window
+
+        if self._count < self.window:
+            n = self._count + 1
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+        else:
+            n = self.window
+            old = self._buffer[slot]
+            old_mean = self._mean.copy()
+            self._mean += (x - old) / n
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+
+        self._buffer[slot] = x
+        self._count += 1
+
+        if self._count % self.window == 0:
+            self._mean = self._buffer.mean(axis=0)
+            self._m2 = ((self._buffer - self._mean) ** 2).sum(axis=0)
+
+        if n < 2:
+            z = np.full(self.n_pairs, np.nan)
+        else:
+            std = np.sqrt(np.maximum(self._m2, 0.0) / (n - 1))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z = (x - self._mean) / std
+
+        # Exits are applied before entries, so a pair can close one side and
+        # open the other on the same bar.
+        previous = self.position.copy()
+        self.position[(previous == 1) & (z >= -self.exit_z)] = 0
+        self.position[(previous == -1) & (z <= self.exit_z)] = 0
+        flat = self.position == 0
+        self.position[flat & (z < -self.entry_z)] = 1
+        self.position[flat & (z > self.entry_z)] = -1
+
+        return z, self.position.copy(), self.position - previous
+
+    def run(self, spreads) -> tuple:
+        '''
+        Batch mode over a (T, n_pairs) block of spreads.
+
+        Returns:
+            Tuple (z, positions, orders) of (T, n_pairs) arrays.
+        '''
+        spreads = np.asarray(spreads, dtype=np.float64)
+        T = spreads.shape[0]
+        z = np.empty((T, self.n_pairs))
+        positions = np.empty((T, self.n_pairs), dtype=np.int8)
+        orders = np.empty((T, self.n_pairs), dtype=np.int8)
+
+        for t in range(T):
+            z[t], positions[t], orders[t] = self.update(spreads[t])
+
+        return z, positions, orders